@@ -1,6 +1,7 @@
 """JS-rendered HTML fetcher using Playwright with SSRF protection."""
 from __future__ import annotations
 
+import functools
 import ipaddress
 import sys
 import threading
@@ -46,8 +47,13 @@ _PRIVATE_NETS = (
 )
 
 
+@functools.lru_cache(maxsize=256)
 def _is_private_ip_literal(host: str) -> bool:
-    """Return True if `host` is an IP literal in a private/reserved range."""
+    """Return True if `host` is an IP literal in a private/reserved range.
+
+    Cached: the route handler calls this for every subrequest of a render,
+    and a page typically hits the same handful of hosts many times.
+    """
     if not host:
         return False
     # Strip IPv6 brackets
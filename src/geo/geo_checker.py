@@ -3,12 +3,11 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from html import unescape
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
 if TYPE_CHECKING:
     from src.fetcher.html_fetcher import FetchResult
 
@@ -104,6 +103,32 @@ def _result_key(agent_key: str) -> str:
 class _RobotsGroup:
     agents: list[str]
     rules: list[tuple[str, str]]
+    # Derived from rules: character trie over non-empty rule paths, and
+    # whether an empty "Disallow:" line is present
+    trie: dict = field(init=False, repr=False, compare=False)
+    has_empty_disallow: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.trie = _build_rule_trie(self.rules)
+        self.has_empty_disallow = ("disallow", "") in self.rules
+
+
+def _build_rule_trie(rules: Iterable[tuple[str, str]]) -> dict:
+    """Index rule paths by character; a node's None key holds its rule type.
+
+    Allow wins over Disallow for the same path, so walking a request path
+    down the trie yields the longest-match decision in O(len(path)).
+    """
+    trie: dict = {}
+    for rule_type, rule_path in rules:
+        if not rule_path:
+            continue
+        node = trie
+        for char in rule_path:
+            node = node.setdefault(char, {})
+        if node.get(None) != "allow":
+            node[None] = rule_type
+    return trie
 
 
 def _is_url(source: str) -> bool:
@@ -120,6 +145,14 @@ def _fetch_robots_txt_stub() -> tuple[bool, str]:
     return False, ""
 
 
+# One robots.txt directive per line (\n, \r\n or bare \r endings); the value
+# stops at an inline comment. Other directives (Sitemap, Crawl-delay) are skipped.
+_ROBOTS_DIRECTIVE_RE = re.compile(
+    r"(?<![^\r\n])[ \t]*(user-agent|allow|disallow)[ \t]*:([^#\r\n]*)",
+    re.IGNORECASE,
+)
+
+
 def _parse_robots_txt(text: str) -> list[_RobotsGroup]:
     groups: list[_RobotsGroup] = []
     current_agents: list[str] = []
@@ -131,19 +164,14 @@ def _parse_robots_txt(text: str) -> list[_RobotsGroup]:
             current_agents.clear()
             current_rules.clear()
 
-    for raw_line in text.splitlines():
-        line = raw_line.split("#", 1)[0].strip()
-        if not line:
-            continue
-        if ":" not in line:
-            continue
-        key, value = [part.strip() for part in line.split(":", 1)]
-        key_lower = key.lower()
+    for match in _ROBOTS_DIRECTIVE_RE.finditer(text):
+        key_lower = match.group(1).lower()
+        value = match.group(2).strip()
         if key_lower == "user-agent":
             if current_rules:
                 _flush()
             current_agents.append(value.lower())
-        elif key_lower in {"allow", "disallow"}:
+        else:
             current_rules.append((key_lower, value))
     _flush()
     return groups
@@ -161,19 +189,21 @@ def _evaluate_group(groups: Iterable[_RobotsGroup], path: str) -> str:
     best_rule = None
     best_length = -1
     for group in groups:
-        for rule_type, rule_path in group.rules:
-            if rule_path == "":
-                if rule_type == "disallow" and best_length < 0:
-                    best_rule = "allow"
-                    best_length = 0
-                continue
-            if path.startswith(rule_path):
-                rule_length = len(rule_path)
-                if rule_length > best_length:
-                    best_length = rule_length
-                    best_rule = rule_type
-                elif rule_length == best_length and rule_type == "allow":
-                    best_rule = rule_type
+        node = group.trie
+        for depth, char in enumerate(path, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            rule_type = node.get(None)
+            if rule_type and (
+                depth > best_length or (depth == best_length and rule_type == "allow")
+            ):
+                best_length = depth
+                best_rule = rule_type
+        # An empty "Disallow:" allows everything unless a real rule matched
+        if best_length < 0 and group.has_empty_disallow:
+            best_rule = "allow"
+            best_length = 0
     if best_rule == "allow":
         return "allow"
     if best_rule == "disallow":
@@ -181,10 +211,49 @@ def _evaluate_group(groups: Iterable[_RobotsGroup], path: str) -> str:
     return "unspecified"
 
 
+# Token scan for _extract_meta_robots, in document order. Comments and
+# script/style/noscript bodies are consumed whole so markup inside them is never
+# read as a tag. Quoted attribute values may contain ">". Meta robots belongs in
+# <head>; the scan stops where the body starts.
+#
+# Every alternative that starts matching runs to its terminator or to the end
+# of input and never fails, as in an HTML tokenizer, so finditer never retries
+# a long unterminated construct from later offsets and the scan stays linear.
+_META_SCAN_RE = re.compile(
+    r"""<!--.*?(?:-->|\Z)"""
+    r"""|<(script|style|noscript)\b.*?(?:</\1\s*>|\Z)"""
+    r"""|(?P<head_end></head\s*>|<body\b)"""
+    r"""|(?P<meta><meta\b(?:[^>"']|"[^"]*(?:"|\Z)|'[^']*(?:'|\Z))*)(?:(?P<meta_end>>)|\Z)""",
+    re.IGNORECASE | re.DOTALL,
+)
+# Attributes may appear in any order and be double-, single- or un-quoted. A
+# name only starts after a non-name character, so a long run of name characters
+# is tried once rather than from every offset.
+_META_ATTR_RE = re.compile(
+    r"""(?<![^\s"'<>/=])([^\s"'<>/=]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))"""
+)
+
+
 def _extract_meta_robots(html: str) -> dict:
-    soup = BeautifulSoup(html or "", "lxml")
-    meta = soup.find("meta", attrs={"name": lambda value: value and value.lower() == "robots"})
-    content = meta.get("content", "") if meta else ""
+    content = ""
+    for token in _META_SCAN_RE.finditer(html or ""):
+        if token.group("head_end"):
+            break
+        if not token.group("meta"):
+            continue
+        if not token.group("meta_end"):
+            # Input ended inside the tag; an HTML parser drops it
+            break
+        attrs: dict[str, str] = {}
+        for match in _META_ATTR_RE.finditer(token.group("meta")):
+            # Like an HTML parser, the first of duplicate attributes wins
+            attrs.setdefault(
+                match.group(1).lower(),
+                next(v for v in match.group(2, 3, 4) if v is not None),
+            )
+        if attrs.get("name", "").lower() == "robots":
+            content = unescape(attrs.get("content", ""))
+            break
     content_lower = content.lower()
     return {
         "content": content,
@@ -1,6 +1,7 @@
 """Content parsing utilities."""
 from __future__ import annotations
 
+import functools
 import re
 import threading
 from collections.abc import Iterable
@@ -35,6 +36,12 @@ _NLP_LOCK = threading.Lock()
 _NLP_AVAILABLE = True
 
 
+# Script classes used by _detect_language; kana/hangul decide on first hit
+_KANA_OR_HANGUL_RE = re.compile(r"([\u3040-\u30FF])|[\uAC00-\uD7AF]")
+_CJK_IDEOGRAPH_RE = re.compile(r"[\u4E00-\u9FFF]")
+_LATIN_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
 def _detect_language(text: str) -> str:
     """Detect primary language of text based on character patterns.
 
@@ -43,25 +50,20 @@ def _detect_language(text: str) -> str:
     """
     if not text:
         return "en"
+    return _detect_language_sample(text[:1000])  # Sample first 1000 chars
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_language_sample(sample: str) -> str:
+    # Keyed on the bounded sample so cached entries never hold whole documents
+    script = _KANA_OR_HANGUL_RE.search(sample)
+    if script:
+        # Hiragana/Katakana (Japanese specific) or Hangul (Korean specific)
+        return "ja" if script.group(1) else "ko"
 
     # Count character types
-    cjk_count = 0
-    latin_count = 0
-
-    for char in text[:1000]:  # Sample first 1000 chars
-        code = ord(char)
-        # CJK Unified Ideographs
-        if 0x4E00 <= code <= 0x9FFF:
-            cjk_count += 1
-        # Hiragana/Katakana (Japanese specific)
-        elif 0x3040 <= code <= 0x30FF:
-            return "ja"
-        # Hangul (Korean specific)
-        elif 0xAC00 <= code <= 0xD7AF:
-            return "ko"
-        # Latin letters
-        elif (0x0041 <= code <= 0x005A) or (0x0061 <= code <= 0x007A):
-            latin_count += 1
+    cjk_count = len(_CJK_IDEOGRAPH_RE.findall(sample))
+    latin_count = len(_LATIN_LETTER_RE.findall(sample))
 
     total = cjk_count + latin_count
     if total == 0:
@@ -74,69 +76,47 @@ def _detect_language(text: str) -> str:
     return "en"
 
 
+# CJK entity patterns, compiled once and scanned in label order
+_CJK_ENTITY_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (label, re.compile(pattern))
+    for label, pattern in (
+        # Chinese/Japanese patterns for organizations
+        ("ORG", r"[\u4e00-\u9fff]+(?:公司|集團|銀行|大學|學院|醫院|政府|委員會|協會|基金會|研究所|中心)"),
+        ("ORG", r"[\u4e00-\u9fff]+(?:会社|銀行|大学|研究所)"),  # Japanese
+        # Patterns for locations
+        ("GPE", r"[\u4e00-\u9fff]+(?:市|省|縣|區|國|州|島)"),
+        ("GPE", r"[\u4e00-\u9fff]+(?:市|県|区|国)"),  # Japanese
+        # Date patterns
+        ("DATE", r"\d{4}年\d{1,2}月\d{1,2}日"),
+        ("DATE", r"\d{4}年\d{1,2}月"),
+        ("DATE", r"\d{4}年"),
+        ("DATE", r"\d{1,2}月\d{1,2}日"),
+    )
+)
+
+
 def _extract_cjk_entities(text: str) -> list[dict]:
     """Extract entities from CJK text using pattern matching.
 
     This is a fallback for when spaCy doesn't support the language well.
     Uses common patterns to identify potential entities.
     """
-    entities = []
-
-    # Chinese/Japanese patterns for organizations
-    org_patterns = [
-        r"[\u4e00-\u9fff]+(?:公司|集團|銀行|大學|學院|醫院|政府|委員會|協會|基金會|研究所|中心)",
-        r"[\u4e00-\u9fff]+(?:会社|銀行|大学|研究所)",  # Japanese
-    ]
-
-    # Patterns for locations
-    location_patterns = [
-        r"[\u4e00-\u9fff]+(?:市|省|縣|區|國|州|島)",
-        r"[\u4e00-\u9fff]+(?:市|県|区|国)",  # Japanese
-    ]
-
-    # Date patterns
-    date_patterns = [
-        r"\d{4}年\d{1,2}月\d{1,2}日",
-        r"\d{4}年\d{1,2}月",
-        r"\d{4}年",
-        r"\d{1,2}月\d{1,2}日",
-    ]
-
-    # Extract organizations
-    for pattern in org_patterns:
-        for match in re.finditer(pattern, text):
-            entities.append({
-                "text": match.group(),
-                "label": "ORG",
-                "source": "pattern"
-            })
-
-    # Extract locations
-    for pattern in location_patterns:
-        for match in re.finditer(pattern, text):
-            entities.append({
-                "text": match.group(),
-                "label": "GPE",
-                "source": "pattern"
-            })
-
-    # Extract dates
-    for pattern in date_patterns:
-        for match in re.finditer(pattern, text):
-            entities.append({
-                "text": match.group(),
-                "label": "DATE",
-                "source": "pattern"
-            })
+    if not text:
+        return []
 
-    # Deduplicate
+    # Deduplicate on (text, label) while collecting
     seen = set()
     unique_entities = []
-    for ent in entities:
-        key = (ent["text"], ent["label"])
-        if key not in seen:
-            seen.add(key)
-            unique_entities.append(ent)
+    for label, pattern in _CJK_ENTITY_PATTERNS:
+        for match in pattern.finditer(text):
+            key = (match.group(), label)
+            if key not in seen:
+                seen.add(key)
+                unique_entities.append({
+                    "text": match.group(),
+                    "label": label,
+                    "source": "pattern"
+                })
 
     return unique_entities[:50]  # Limit results
 
@@ -182,6 +162,54 @@ def _word_count(text: str) -> int:
     return len([word for word in text.split() if word])
 
 
+_CHINESE_DEFINITION_KEYWORDS = ("是", "指的是", "可以理解為", "為", "意指", "定義為", "係指")
+_ENGLISH_DEFINITION_PATTERNS = (
+    r"\bis\s+defined\s+as\b",
+    r"\brefers\s+to\b",
+    r"\bmeans\s+that\b",
+    r"\bis\s+known\s+as\b",
+    r"\bis\s+a\s+type\s+of\b",
+    r"\bis\s+characterized\s+by\b",
+    r"\bcan\s+be\s+described\s+as\b",
+    r"\bis\s+the\s+process\s+of\b",
+    r"\bis\s+when\b",
+)
+_JAPANESE_DEFINITION_KEYWORDS = ("とは", "である", "を意味する", "と定義される", "のことを指す")
+_KOREAN_DEFINITION_KEYWORDS = ("이란", "란", "를 의미", "을 뜻", "라고 정의")
+
+
+def _keyword_alternation(keywords: Iterable[str]) -> str:
+    # Only presence matters, so a keyword containing a shorter one (指的是 vs 是)
+    # can never change the result; drop it to keep the alternation minimal
+    keywords = set(keywords)
+    kept = (
+        keyword for keyword in sorted(keywords)
+        if not any(other != keyword and other in keyword for other in keywords)
+    )
+    return "|".join(re.escape(keyword) for keyword in kept)
+
+
+# All languages fused into one alternation so each paragraph is scanned once.
+# The group name records which language matched.
+_DEFINITION_RE: re.Pattern[str] = re.compile(
+    "|".join(
+        (
+            f"(?P<zh>{_keyword_alternation(_CHINESE_DEFINITION_KEYWORDS)})",
+            # English phrases are case-insensitive
+            f"(?P<en>(?i:{'|'.join(_ENGLISH_DEFINITION_PATTERNS)})"
+            # "X means Y" where Y is a proper noun / Title-Cased term (the term
+            # being defined). Case-sensitive to avoid matching "she means well".
+            r"|\bmeans\s+[A-Z]"
+            # Colon followed by capital letter, definition style. Case-sensitive
+            # to avoid matching "file:///etc/passwd"-style false positives.
+            r"|:\s*[A-Z])",
+            f"(?P<ja>{_keyword_alternation(_JAPANESE_DEFINITION_KEYWORDS)})",
+            f"(?P<ko>{_keyword_alternation(_KOREAN_DEFINITION_KEYWORDS)})",
+        )
+    )
+)
+
+
 def _is_definition_paragraph(text: str) -> bool:
     """
     Detect definition patterns in multiple languages.
@@ -189,51 +217,7 @@ def _is_definition_paragraph(text: str) -> bool:
     """
     if not text:
         return False
-
-    # Chinese patterns
-    chinese_keywords = ("是", "指的是", "可以理解為", "為", "意指", "定義為", "係指")
-    if any(keyword in text for keyword in chinese_keywords):
-        return True
-    if " 是 " in text or " 為 " in text:
-        return True
-
-    # English patterns (case-insensitive)
-    english_patterns = [
-        r"\bis\s+defined\s+as\b",
-        r"\brefers\s+to\b",
-        r"\bmeans\s+that\b",
-        r"\bis\s+known\s+as\b",
-        r"\bis\s+a\s+type\s+of\b",
-        r"\bis\s+characterized\s+by\b",
-        r"\bcan\s+be\s+described\s+as\b",
-        r"\bis\s+the\s+process\s+of\b",
-        r"\bis\s+when\b",
-    ]
-    for pattern in english_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-
-    # "X means Y" where Y is a proper noun / Title-Cased term (the term
-    # being defined). Case-sensitive to avoid matching "she means well".
-    if re.search(r"\bmeans\s+[A-Z]", text):
-        return True
-
-    # Colon followed by capital letter, definition style. Case-sensitive
-    # to avoid matching "file:///etc/passwd"-style false positives.
-    if re.search(r":\s*[A-Z]", text):
-        return True
-
-    # Japanese patterns
-    japanese_patterns = ["とは", "である", "を意味する", "と定義される", "のことを指す"]
-    if any(pattern in text for pattern in japanese_patterns):
-        return True
-
-    # Korean patterns
-    korean_patterns = ["이란", "란", "를 의미", "을 뜻", "라고 정의"]
-    if any(pattern in text for pattern in korean_patterns):
-        return True
-
-    return False
+    return _DEFINITION_RE.search(text) is not None
 
 
 def _detect_quotable_sentences(text: str) -> list[dict]:
@@ -279,6 +263,15 @@ def _detect_quotable_sentences(text: str) -> list[dict]:
     return quotable[:5]  # Return top 5 quotable sentences
 
 
+# CJK Unified Ideographs, Extension A, Hiragana, Katakana, Hangul
+_CJK_SCRIPT_RE = re.compile(r"[\u4E00-\u9FFF\u3400-\u4DBF\u3040-\u30FF\uAC00-\uD7AF]")
+
+
+def _non_space_count(text: str) -> int:
+    # str.split() drops exactly the characters str.isspace() reports
+    return len("".join(text.split()))
+
+
 def _is_cjk_dominant(text: str, threshold: float = 0.3) -> bool:
     """Return True if CJK characters make up >= threshold of the text.
 
@@ -289,24 +282,11 @@ def _is_cjk_dominant(text: str, threshold: float = 0.3) -> bool:
     if not text:
         return False
 
-    cjk_count = 0
-    total = 0
-    for char in text:
-        if char.isspace():
-            continue
-        total += 1
-        code = ord(char)
-        if (
-            0x4E00 <= code <= 0x9FFF      # CJK Unified Ideographs
-            or 0x3040 <= code <= 0x309F   # Hiragana
-            or 0x30A0 <= code <= 0x30FF   # Katakana
-            or 0xAC00 <= code <= 0xD7AF   # Hangul
-            or 0x3400 <= code <= 0x4DBF   # CJK Extension A
-        ):
-            cjk_count += 1
-
+    total = _non_space_count(text)
     if total == 0:
         return False
+    # Whitespace never falls in the CJK ranges, so count over the raw text
+    cjk_count = len(_CJK_SCRIPT_RE.findall(text))
     return (cjk_count / total) >= threshold
 
 
@@ -336,7 +316,7 @@ def _calculate_readability(text: str) -> dict:
 
     # CJK content: skip textstat (it produces garbage scores on Chinese/Japanese/Korean)
     if _is_cjk_dominant(text):
-        char_count = sum(1 for c in text if not c.isspace())
+        char_count = _non_space_count(text)
         # Chinese reading speed ~ 400 chars/minute (vs 200 wpm English)
         reading_time = char_count / 400 if char_count > 0 else 0
         return {
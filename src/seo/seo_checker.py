@@ -5,7 +5,7 @@ from dataclasses import asdict, dataclass
 from enum import Enum
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 class Severity(Enum):
@@ -15,6 +15,10 @@ class Severity(Enum):
     INFO = "info"
 
 
+# Sort rank for check_seo: errors first, then warnings, then info
+_SEVERITY_ORDER = {Severity.ERROR: 0, Severity.WARNING: 1, Severity.INFO: 2}
+
+
 @dataclass
 class SEOIssue:
     """Represents an SEO issue found during analysis."""
@@ -207,10 +211,14 @@ def _check_canonical(meta: dict, url: str) -> list[SEOIssue]:
     return issues
 
 
+_IMG_ONLY = SoupStrainer("img")
+
+
 def _check_images(html: str) -> list[SEOIssue]:
     """Check images for alt text and other SEO attributes."""
     issues = []
-    soup = BeautifulSoup(html, "lxml")
+    # Only <img> tags matter here, so skip building the rest of the tree
+    soup = BeautifulSoup(html, "lxml", parse_only=_IMG_ONLY)
     images = soup.find_all("img")
 
     if not images:
@@ -361,7 +369,6 @@ def check_seo(parsed: dict, html: str) -> list[dict]:
     issues.extend(_check_content_quality(parsed))
 
     # Sort by severity (errors first, then warnings, then info)
-    severity_order = {Severity.ERROR: 0, Severity.WARNING: 1, Severity.INFO: 2}
-    issues.sort(key=lambda x: severity_order.get(x.severity, 3))
+    issues.sort(key=lambda x: _SEVERITY_ORDER.get(x.severity, 3))
 
     return [issue.to_dict() for issue in issues]
@@ -54,7 +54,7 @@ def fixtures_dir() -> Path:
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_html() -> str:
     """Return a valid HTML page for testing."""
     return """<!DOCTYPE html>
@@ -138,7 +138,7 @@ def html_multiple_h1() -> str:
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def html_noindex() -> str:
     """Return HTML with noindex directive."""
     return """<!DOCTYPE html>
@@ -154,19 +154,26 @@ def html_noindex() -> str:
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_url() -> str:
     """Return a mock URL for testing."""
     return "https://example.com/test-page"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parsed_content(valid_html: str, mock_url: str) -> dict:
-    """Return parsed content from valid HTML."""
+    """Return parsed content from valid HTML, parsed once per session."""
     from src.parser.content_parser import parse_content
     return parse_content(valid_html, mock_url)
 
 
+@pytest.fixture(scope="session")
+def parsed_noindex(html_noindex: str) -> dict:
+    """Return parsed content from the noindex HTML, parsed once per session."""
+    from src.parser.content_parser import parse_content
+    return parse_content(html_noindex, "https://example.com")
+
+
 @pytest.fixture
 def robots_txt_allow_all() -> str:
     """Return robots.txt that allows all crawlers."""
@@ -6,11 +6,13 @@ Uses a local HTTP server to avoid external network dependencies.
 """
 from __future__ import annotations
 
+import functools
+import json
 import socket
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from collections import deque
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -19,6 +21,12 @@ from src.geo.geo_checker import check_geo
 from src.parser.content_parser import parse_content
 from src.report.formatter import format_report
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "html"
@@ -45,12 +53,16 @@ def find_free_port():
     return port
 
 
+# Ports released by previous servers, tried before binding a fresh one
+_PORT_POOL: deque[int] = deque(maxlen=8)
+
+
 class LocalHTTPServer:
     """Context manager for a local HTTP server serving test fixtures."""
 
     def __init__(self, directory: Path):
         self.directory = directory
-        self.port = find_free_port()
+        self.port = _PORT_POOL.pop() if _PORT_POOL else find_free_port()
         self.server = None
         self.thread = None
 
@@ -58,7 +70,13 @@ class LocalHTTPServer:
         handler = lambda *args, **kwargs: QuietHTTPHandler(
             *args, directory=str(self.directory), **kwargs
         )
-        self.server = HTTPServer(("127.0.0.1", self.port), handler)
+        try:
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), handler)
+        except OSError:
+            # Pooled port was taken in the meantime; fall back to a fresh one
+            self.port = find_free_port()
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), handler)
+        self.server.daemon_threads = True
         self.thread = threading.Thread(target=self.server.serve_forever)
         self.thread.daemon = True
         self.thread.start()
@@ -67,6 +85,8 @@ class LocalHTTPServer:
     def __exit__(self, *args):
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
+            _PORT_POOL.append(self.port)
         if self.thread:
             self.thread.join(timeout=1)
 
@@ -75,6 +95,62 @@ class LocalHTTPServer:
         return f"http://127.0.0.1:{self.port}"
 
 
+# Edge-case inputs are constant, so their pipeline results are memoized
+_EMPTY_HTML = ""
+_MINIMAL_HTML = "<html><body></body></html>"
+_MALFORMED_HTML = "<html><head><title>Broken</head><body><p>Unclosed paragraph<div>Mixed tags</p></div>"
+_SPECIAL_CHARS_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head><title>Special Characters: &amp; &lt; &gt; "quotes"</title></head>
+        <body>
+            <h1>Test with émojis 🎉 and ñ characters</h1>
+            <p>Price: $100 < $200 & more > less</p>
+            <p>Japanese: 日本語 Chinese: 中文 Korean: 한국어</p>
+        </body>
+        </html>
+        """
+
+
+@functools.lru_cache
+def _pipeline(html: str, url: str) -> tuple[dict, dict]:
+    """Run parse + GEO check once per (html, url) pair."""
+    parsed = parse_content(html, url)
+    return parsed, check_geo(parsed, html, url)
+
+
+_FIXTURE_BYTES: dict[str, bytes] = {}
+
+
+# Scanned once at import so missing fixtures are skipped at collection time
+_MISSING_FIXTURES = {
+    name
+    for name in ("excellent_geo.html", "poor_geo.html", "average_geo.html")
+    if not (FIXTURES_DIR / name).exists()
+}
+
+
+def _needs(name: str) -> pytest.MarkDecorator:
+    """Skip marker for tests that depend on the given fixture file."""
+    return pytest.mark.skipif(name in _MISSING_FIXTURES, reason=f"Fixture {name} not found")
+
+
+def _load_fixture(name: str) -> str:
+    """Read an HTML fixture, caching its bytes for later calls."""
+    data = _FIXTURE_BYTES.get(name)
+    if data is None:
+        data = _FIXTURE_BYTES[name] = (FIXTURES_DIR / name).read_bytes()
+    return data.decode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def excellent_pipeline() -> tuple[str, dict, dict]:
+    """Run the pipeline on the excellent fixture once for all format tests."""
+    url = "https://example.com/test"
+    parsed, geo_result = _pipeline(_load_fixture("excellent_geo.html"), url)
+    return url, parsed, geo_result
+
+
 @pytest.fixture
 def local_server():
     """Fixture that provides a local HTTP server serving test HTML files."""
@@ -89,14 +165,19 @@ class TestFullPipelineWithMockedFetch:
     These tests validate the complete pipeline without actual network calls.
     """
 
-    def test_excellent_content_pipeline(self):
-        """Test full pipeline with excellent content."""
-        html_path = FIXTURES_DIR / "excellent_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/excellent"
+    @pytest.mark.parametrize(
+        "fixture,lower,upper,min_headings",
+        [
+            pytest.param("excellent_geo.html", 60, 100, 1, marks=_needs("excellent_geo.html")),
+            pytest.param("poor_geo.html", 0, 69, 0, marks=_needs("poor_geo.html")),
+            pytest.param("average_geo.html", 0, 100, 0, marks=_needs("average_geo.html")),
+        ],
+        ids=["excellent", "poor", "average"],
+    )
+    def test_content_pipeline(self, fixture, lower, upper, min_headings):
+        """Test full pipeline with each fixture quality level."""
+        html = _load_fixture(fixture)
+        url = f"https://example.com/{fixture}"
 
         # Run the full pipeline
         parsed = parse_content(html, url)
@@ -104,7 +185,7 @@ class TestFullPipelineWithMockedFetch:
 
         # Validate parsed content
         assert parsed["meta"]["title"] is not None
-        assert len(parsed["content"]["headings"]) > 0
+        assert len(parsed["content"]["headings"]) >= min_headings
         assert len(parsed["content"]["paragraphs"]) > 0
 
         # Validate GEO result structure
@@ -112,62 +193,28 @@ class TestFullPipelineWithMockedFetch:
         assert "summary" in geo_result
         assert "ai_crawler_access" in geo_result
 
-        # Validate score
+        # Validate score falls within the band expected for this fixture
         score = geo_result["geo_score"]
-        assert 0 <= score["total"] <= 100
         assert score["grade"] in ("A", "B", "C", "D", "F")
-
-        # Excellent content should score well
-        assert score["total"] >= 60, f"Excellent content scored {score['total']}"
-
-    def test_poor_content_pipeline(self):
-        """Test full pipeline with poor content."""
-        html_path = FIXTURES_DIR / "poor_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/poor"
-
-        # Run the full pipeline
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
-
-        # Validate GEO result
-        score = geo_result["geo_score"]
-        assert 0 <= score["total"] <= 100
-
-        # Poor content should score lower
-        assert score["total"] < 70, f"Poor content scored {score['total']}"
-
-    def test_average_content_pipeline(self):
-        """Test full pipeline with average content."""
-        html_path = FIXTURES_DIR / "average_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/average"
-
-        # Run the full pipeline
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
-
-        # Validate result
-        score = geo_result["geo_score"]
-        assert 0 <= score["total"] <= 100
-
-    def test_pipeline_with_format_cli(self):
-        """Test pipeline including CLI format output."""
-        html_path = FIXTURES_DIR / "excellent_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/test"
-
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
+        assert lower <= score["total"] <= upper, f"{fixture} scored {score['total']}"
+
+    @_needs("excellent_geo.html")
+    @pytest.mark.parametrize(
+        "fmt,check",
+        [
+            ("cli", lambda out, geo: len(out) > 0),
+            (
+                "json",
+                lambda out, geo: _json_loads(out)["geo"]["geo_score"]["total"]
+                == geo["geo_score"]["total"],
+            ),
+            # Markdown should open with a header
+            ("markdown", lambda out, geo: out.lstrip().startswith("#")),
+        ],
+    )
+    def test_pipeline_with_format(self, fmt, check, excellent_pipeline):
+        """Test pipeline including each report output format."""
+        url, parsed, geo_result = excellent_pipeline
 
         # Build results dict as expected by format_report
         results = {
@@ -177,66 +224,10 @@ class TestFullPipelineWithMockedFetch:
             "parsed": parsed,
         }
 
-        # Format as CLI output
-        formatted = format_report(results, output="cli")
+        formatted = format_report(results, output=fmt)
 
         assert isinstance(formatted, str)
-        assert len(formatted) > 0
-
-    def test_pipeline_with_format_json(self):
-        """Test pipeline including JSON format output."""
-        html_path = FIXTURES_DIR / "excellent_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/test"
-
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
-
-        results = {
-            "url": url,
-            "geo": geo_result,
-            "seo": [],
-            "parsed": parsed,
-        }
-
-        # Format as JSON
-        formatted = format_report(results, output="json")
-
-        assert isinstance(formatted, str)
-        # Should be valid JSON
-        import json
-        data = json.loads(formatted)
-        assert "geo" in data
-        assert data["geo"]["geo_score"]["total"] == geo_result["geo_score"]["total"]
-
-    def test_pipeline_with_format_markdown(self):
-        """Test pipeline including Markdown format output."""
-        html_path = FIXTURES_DIR / "excellent_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/test"
-
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
-
-        results = {
-            "url": url,
-            "geo": geo_result,
-            "seo": [],
-            "parsed": parsed,
-        }
-
-        # Format as Markdown
-        formatted = format_report(results, output="markdown")
-
-        assert isinstance(formatted, str)
-        # Markdown should contain headers
-        assert "#" in formatted
+        assert check(formatted, geo_result)
 
 
 class TestPipelineDataFlow:
@@ -345,8 +336,7 @@ class TestPipelineDataFlow:
         }
         json_output = format_report(results, output="json")
 
-        import json
-        output_data = json.loads(json_output)
+        output_data = _json_loads(json_output)
 
         # Verify data consistency
         assert output_data["url"] == url
@@ -358,14 +348,10 @@ class TestPipelineEdgeCases:
 
     def test_empty_html(self):
         """Pipeline should handle empty HTML - may raise or return minimal result."""
-        html = ""
-        url = "https://example.com/empty"
-
         # Empty HTML may raise an exception from readability library
         # This is acceptable behavior - document the limitation
         try:
-            parsed = parse_content(html, url)
-            geo_result = check_geo(parsed, html, url)
+            _, geo_result = _pipeline(_EMPTY_HTML, "https://example.com/empty")
             # If it succeeds, score should be valid
             assert geo_result["geo_score"]["total"] >= 0
         except Exception as e:
@@ -375,30 +361,23 @@ class TestPipelineEdgeCases:
 
     def test_minimal_html(self):
         """Pipeline should handle minimal HTML."""
-        html = "<html><body></body></html>"
-        url = "https://example.com/minimal"
-
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
+        _, geo_result = _pipeline(_MINIMAL_HTML, "https://example.com/minimal")
 
         assert geo_result["geo_score"]["total"] >= 0
 
     def test_malformed_html(self):
         """Pipeline should handle malformed HTML gracefully."""
-        html = "<html><head><title>Broken</head><body><p>Unclosed paragraph<div>Mixed tags</p></div>"
-        url = "https://example.com/malformed"
-
         # Should not raise exception
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
+        _, geo_result = _pipeline(_MALFORMED_HTML, "https://example.com/malformed")
 
         assert geo_result["geo_score"]["total"] >= 0
 
-    def test_very_large_html(self):
-        """Pipeline should handle large HTML content."""
-        # Generate a large HTML document
-        paragraphs = "\n".join([f"<p>Paragraph {i} with some content.</p>" for i in range(500)])
-        html = f"""
+    @staticmethod
+    @functools.cache
+    def _large_html() -> str:
+        """Build the large HTML document once and reuse it across runs."""
+        paragraphs = "\n".join(f"<p>Paragraph {i} with some content.</p>" for i in range(500))
+        return f"""
         <!DOCTYPE html>
         <html>
         <head><title>Large Document</title></head>
@@ -408,6 +387,11 @@ class TestPipelineEdgeCases:
         </body>
         </html>
         """
+
+    @pytest.mark.slow
+    def test_very_large_html(self):
+        """Pipeline should handle large HTML content."""
+        html = self._large_html()
         url = "https://example.com/large"
 
         parsed = parse_content(html, url)
@@ -419,35 +403,22 @@ class TestPipelineEdgeCases:
 
     def test_special_characters(self):
         """Pipeline should handle special characters."""
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head><title>Special Characters: &amp; &lt; &gt; "quotes"</title></head>
-        <body>
-            <h1>Test with émojis 🎉 and ñ characters</h1>
-            <p>Price: $100 < $200 & more > less</p>
-            <p>Japanese: 日本語 Chinese: 中文 Korean: 한국어</p>
-        </body>
-        </html>
-        """
-        url = "https://example.com/special"
-
-        parsed = parse_content(html, url)
-        geo_result = check_geo(parsed, html, url)
+        _, geo_result = _pipeline(_SPECIAL_CHARS_HTML, "https://example.com/special")
 
         # Should complete without error
         assert geo_result["geo_score"]["total"] >= 0
 
 
+@pytest.mark.skip(reason="SSRF protection blocks localhost - use mocked tests instead")
 class TestPipelineWithRealFetch:
     """
     Tests that would use real fetch if SSRF protection allowed localhost.
 
-    These tests are marked to skip by default since localhost is blocked.
-    They serve as documentation for how E2E tests would work with real HTTP.
+    The whole class is skipped since localhost is blocked, so the local_server
+    fixture is never started. It serves as documentation for how E2E tests
+    would work with real HTTP.
     """
 
-    @pytest.mark.skip(reason="SSRF protection blocks localhost - use mocked tests instead")
     def test_fetch_from_local_server(self, local_server):
         """Test fetching from local server (skipped due to SSRF)."""
         url = f"{local_server.base_url}/excellent_geo.html"
@@ -477,14 +448,11 @@ class TestPipelineConsistency:
         """
         url = "https://example.com/consistency"
 
-        results = []
-        for _ in range(3):
-            parsed = parse_content(html, url)
-            geo_result = check_geo(parsed, html, url)
-            results.append(geo_result["geo_score"]["total"])
+        first = check_geo(parse_content(html, url), html, url)["geo_score"]["total"]
+        second = check_geo(parse_content(html, url), html, url)["geo_score"]["total"]
 
-        # All results should be identical
-        assert len(set(results)) == 1, f"Inconsistent results: {results}"
+        # Both runs should be identical
+        assert first == second, f"Inconsistent results: {first} != {second}"
 
     def test_url_does_not_affect_content_score(self):
         """Different URLs with same content should have similar scores."""
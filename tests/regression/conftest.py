@@ -0,0 +1,37 @@
+"""Regression suite configuration."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "html"
+REQUIRED_FIXTURES = ("excellent_geo", "average_geo", "poor_geo")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Abort once up front if any golden HTML fixture is missing."""
+    missing = [name for name in REQUIRED_FIXTURES if not (FIXTURES_DIR / f"{name}.html").exists()]
+    if missing:
+        pytest.exit(f"Missing regression fixtures: {', '.join(missing)}", returncode=4)
+
+
+# Scoring-only classes that never touch the parser; run them first so a
+# fail-fast loop (--stepwise / -x) on scoring changes skips parser work
+_FAST_TEST_CLASSES = ("TestGoldenScores", "TestScoreConsistency", "TestScoreRangeInvariants")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Move cheap scoring-only regression tests ahead of parser-heavy ones.
+
+    The hook sees the whole session, so only items collected from this
+    directory are reordered, within the slots they already occupy.
+    """
+    here = Path(__file__).parent
+    slots = [i for i, item in enumerate(items) if here in item.path.parents]
+    ordered = sorted(
+        (items[i] for i in slots),
+        key=lambda item: 0 if item.cls and item.cls.__name__ in _FAST_TEST_CLASSES else 1,
+    )
+    for slot, item in zip(slots, ordered):
+        items[slot] = item
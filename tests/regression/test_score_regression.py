@@ -13,120 +13,136 @@ Golden data approach:
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
 
 import pytest
 
-from src.geo.geo_checker import _calculate_geo_score, check_geo
+from src.geo.geo_checker import _calculate_geo_score
 from src.parser.content_parser import parse_content
 
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "html"
+FIXTURE_URLS = {
+    "excellent_geo": "https://example.com/machine-learning-guide",
+    "average_geo": "https://example.com/services",
+    "poor_geo": "https://example.com/info",
+}
+
+# Shared read-only inputs; copy with dict(...) before mutating
+_BASE_ROBOTS = MappingProxyType({
+    "meta_robots": {"noindex": False, "nofollow": False},
+    "x_robots_tag": {"noindex": False, "nofollow": False},
+})
+_ALL_ALLOWED = MappingProxyType({
+    **dict.fromkeys(("gptbot", "claudebot", "perplexitybot", "google_extended"), "allow"),
+    **_BASE_ROBOTS,
+})
+_ONE_BLOCKED = MappingProxyType({**_ALL_ALLOWED, "gptbot": "disallow"})
+_NOINDEX_ACCESS = MappingProxyType({
+    **_ALL_ALLOWED,
+    "meta_robots": {"noindex": True, "nofollow": False},
+})
+# The scorer only counts entities and reads quotable "type"; build them once
+_TEN_ENTITIES = tuple(MappingProxyType({"name": f"e{i}"}) for i in range(10))
+_FIVE_ENTITIES = tuple(MappingProxyType({"name": f"entity{i}"}) for i in range(5))
+_STATISTIC_AND_CITATION = (
+    MappingProxyType({"type": "statistic"}),
+    MappingProxyType({"type": "citation"}),
+)
+# Mock AI access that allows all crawlers, shaped like check_geo's output
+MOCK_AI_ACCESS_ALLOW_ALL = MappingProxyType({
+    "robots_txt_found": True,
+    "gptbot": "allow",
+    "claudebot": "allow",
+    "perplexitybot": "allow",
+    "google_extended": "allow",
+    "meta_robots": {"content": "", "noindex": False, "nofollow": False},
+    "x_robots_tag": {"value": "", "noindex": False, "nofollow": False},
+    "notes": "",
+})
+_EMPTY_PARSED = MappingProxyType({
+    "content_surface_size": {"components": {}},
+    "stats": {},
+    "schema_org": {"available": False},
+    "readability": {"available": False},
+    "quotable_sentences": [],
+    "entities": [],
+    "content": {"headings": [], "paragraphs": []},
+})
+
+
+def _accessibility(result: dict) -> int:
+    return result["breakdown"]["accessibility"]["score"]
+
+
+def _structure(result: dict) -> int:
+    return result["breakdown"]["structure"]["score"]
+
+
+def _quality(result: dict) -> int:
+    return result["breakdown"]["quality"]["score"]
+
+
+@pytest.fixture(scope="session")
+def fixture_html() -> dict[str, str]:
+    """Read every HTML fixture once per session, keyed by file stem."""
+    # Presence of the required fixtures is checked once in conftest.py
+    return {path.stem: path.read_text() for path in FIXTURES_DIR.glob("*.html")}
+
+
+@pytest.fixture(scope="session")
+def parsed_fixtures(fixture_html: dict[str, str]) -> dict[str, dict]:
+    """Parse each regression fixture once per session."""
+    return {name: parse_content(fixture_html[name], url) for name, url in FIXTURE_URLS.items()}
 
 
 class TestScoreRegressionWithFixtures:
     """Regression tests using HTML fixtures."""
 
-    @pytest.fixture
-    def mock_ai_access_allow_all(self):
-        """Mock AI access that allows all crawlers."""
-        return {
-            "robots_txt_found": True,
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"content": "", "noindex": False, "nofollow": False},
-            "x_robots_tag": {"value": "", "noindex": False, "nofollow": False},
-            "notes": "",
-        }
-
-    def test_excellent_geo_fixture(self, mock_ai_access_allow_all):
-        """
-        Excellent GEO fixture should score 75+ (Grade B or better).
-
-        This fixture has:
-        - All AI crawlers allowed
-        - Article, FAQ, Breadcrumb Schema.org
-        - Multiple headings with good hierarchy
-        - Lists and tables
-        - Definitions and statistics
-        - Citations and quotable content
-        """
-        html_path = FIXTURES_DIR / "excellent_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture file not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/machine-learning-guide"
-        parsed = parse_content(html, url)
-
-        result = _calculate_geo_score(parsed, mock_ai_access_allow_all, [])
-
-        # Expected: Grade B or A (75+)
-        assert result["total"] >= 75, f"Excellent fixture scored {result['total']}, expected >= 75"
-        assert result["grade"] in ("A", "B"), f"Expected grade A or B, got {result['grade']}"
+    @pytest.mark.parametrize(
+        "name,score_range,grades,breakdown_floor",
+        [
+            # Excellent: all AI crawlers allowed; Article, FAQ, Breadcrumb Schema.org;
+            # good heading hierarchy; lists, tables, definitions, statistics, citations.
+            # Expected: Grade B or A (75+)
+            (
+                "excellent_geo",
+                (75, 101),
+                {"A", "B"},
+                {"accessibility": 40, "structure": 20, "quality": 15},
+            ),
+            # Average: basic meta tags; some headings and lists; no Schema.org;
+            # limited quotable content. Expected: Grade C or D (40-74)
+            ("average_geo", (40, 75), {"C", "D"}, {}),
+            # Poor: minimal meta tags; no headings or structured content; poor
+            # readability. Expected: Grade D or F (below 60)
+            ("poor_geo", (0, 60), {"D", "F"}, {}),
+        ],
+        ids=["excellent", "average", "poor"],
+    )
+    def test_fixture_scores(self, parsed_fixtures, name, score_range, grades, breakdown_floor):
+        """Each fixture should stay within its golden score band and grades."""
+        result = _calculate_geo_score(parsed_fixtures[name], MOCK_AI_ACCESS_ALLOW_ALL, [])
+
+        low, high = score_range
+        assert low <= result["total"] < high, (
+            f"{name} scored {result['total']}, expected {low}-{high - 1}"
+        )
+        assert result["grade"] in grades, f"Expected grade in {sorted(grades)}, got {result['grade']}"
 
         # Breakdown expectations
         breakdown = result["breakdown"]
-        assert breakdown["accessibility"]["score"] == 40, "Should have full accessibility"
-        assert breakdown["structure"]["score"] >= 20, "Should have good structure"
-        assert breakdown["quality"]["score"] >= 15, "Should have good quality"
-
-    def test_average_geo_fixture(self, mock_ai_access_allow_all):
-        """
-        Average GEO fixture should score 50-74 (Grade C or D).
-
-        This fixture has:
-        - Basic meta tags
-        - Some headings and lists
-        - No Schema.org
-        - Limited quotable content
-        """
-        html_path = FIXTURES_DIR / "average_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture file not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/services"
-        parsed = parse_content(html, url)
-
-        result = _calculate_geo_score(parsed, mock_ai_access_allow_all, [])
-
-        # Expected: Grade C or D (40-74)
-        assert 40 <= result["total"] < 75, f"Average fixture scored {result['total']}, expected 40-74"
-        assert result["grade"] in ("C", "D"), f"Expected grade C or D, got {result['grade']}"
-
-    def test_poor_geo_fixture(self, mock_ai_access_allow_all):
-        """
-        Poor GEO fixture should score below 50 (Grade D or F).
-
-        This fixture has:
-        - Minimal meta tags
-        - No headings
-        - No structured content
-        - Poor readability
-        """
-        html_path = FIXTURES_DIR / "poor_geo.html"
-        if not html_path.exists():
-            pytest.skip("Fixture file not found")
-
-        html = html_path.read_text()
-        url = "https://example.com/info"
-        parsed = parse_content(html, url)
-
-        result = _calculate_geo_score(parsed, mock_ai_access_allow_all, [])
-
-        # Expected: Grade D or F (below 60)
-        assert result["total"] < 60, f"Poor fixture scored {result['total']}, expected < 60"
-        assert result["grade"] in ("D", "F"), f"Expected grade D or F, got {result['grade']}"
+        for dimension, floor in breakdown_floor.items():
+            assert breakdown[dimension]["score"] >= floor, (
+                f"{name} {dimension} scored {breakdown[dimension]['score']}, expected >= {floor}"
+            )
 
 
 class TestScoreConsistency:
     """Tests for score calculation consistency."""
 
     def test_same_input_same_output(self):
-        """Same input should always produce the same score."""
+        """Same input should always produce the same (golden) score."""
         parsed = {
             "content_surface_size": {"components": {"list_blocks": 2}},
             "stats": {"heading_count": 3, "content_ratio": 0.6},
@@ -136,47 +152,20 @@ class TestScoreConsistency:
             "entities": [{"name": "test"}],
             "content": {"headings": [], "paragraphs": []},
         }
-        ai_access = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        # Calculate score multiple times
-        scores = [_calculate_geo_score(parsed, ai_access, [])["total"] for _ in range(5)]
-
-        # All scores should be identical
-        assert len(set(scores)) == 1, f"Inconsistent scores: {scores}"
-
-    def test_deterministic_grade_assignment(self):
-        """Grade assignment should be deterministic at boundaries."""
-        parsed = {
-            "content_surface_size": {"components": {}},
-            "stats": {},
-            "schema_org": {"available": False},
-            "readability": {"available": False},
-            "quotable_sentences": [],
-            "content": {"headings": [], "paragraphs": []},
-        }
-
-        # Test at grade boundaries
-        test_cases = [
-            ({"gptbot": "allow", "claudebot": "allow", "perplexitybot": "allow", "google_extended": "allow"}, "accessibility"),
-            ({"gptbot": "disallow", "claudebot": "allow", "perplexitybot": "allow", "google_extended": "allow"}, "one_blocked"),
-        ]
-
-        for access_pattern, label in test_cases:
-            ai_access = {
-                **access_pattern,
-                "meta_robots": {"noindex": False, "nofollow": False},
-                "x_robots_tag": {"noindex": False, "nofollow": False},
-            }
-            results = [_calculate_geo_score(parsed, ai_access, []) for _ in range(3)]
-            grades = [r["grade"] for r in results]
-            assert len(set(grades)) == 1, f"Inconsistent grades for {label}: {grades}"
+        # The function is pure, so one call pinned to a golden value proves
+        # the output is stable (update if algorithm changes intentionally)
+        score = _calculate_geo_score(parsed, _ALL_ALLOWED, [])["total"]
+        assert score == 74, f"Score drifted: {score}"
+
+    @pytest.mark.parametrize(
+        "ai_access,expected_grade",
+        [(_ALL_ALLOWED, "D"), (_ONE_BLOCKED, "D")],
+        ids=["all_allowed", "one_blocked"],
+    )
+    def test_pinned_grade_for_empty_page(self, ai_access, expected_grade):
+        """An empty page scores to the pinned grade under each access profile."""
+        grade = _calculate_geo_score(_EMPTY_PARSED, ai_access, [])["grade"]
+        assert grade == expected_grade
 
 
 class TestScoreRangeInvariants:
@@ -199,95 +188,72 @@ class TestScoreRangeInvariants:
             "stats": {"content_ratio": 0.7},
             "schema_org": {"available": False},
             "readability": {"available": True, "flesch_reading_ease": 60},
-            "quotable_sentences": [{"type": "statistic"}, {"type": "citation"}],
-            "entities": [{"name": f"e{i}"} for i in range(10)],
+            "quotable_sentences": _STATISTIC_AND_CITATION,
+            "entities": _TEN_ENTITIES,
             "content": {"headings": [], "paragraphs": []},
         }
 
-        ai_access = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        base_score = _calculate_geo_score(base_parsed, ai_access, [])
-        enhanced_score = _calculate_geo_score(enhanced_parsed, ai_access, [])
+        base_score = _calculate_geo_score(base_parsed, _ALL_ALLOWED, [])
+        enhanced_score = _calculate_geo_score(enhanced_parsed, _ALL_ALLOWED, [])
 
-        assert enhanced_score["breakdown"]["quality"]["score"] >= base_score["breakdown"]["quality"]["score"]
+        assert _quality(enhanced_score) >= _quality(base_score)
 
     def test_blocking_crawlers_always_decreases_accessibility(self):
         """Blocking AI crawlers should always decrease accessibility score."""
-        parsed = {
-            "content_surface_size": {"components": {}},
-            "stats": {},
-            "schema_org": {"available": False},
-            "readability": {"available": False},
-            "quotable_sentences": [],
-            "content": {"headings": [], "paragraphs": []},
-        }
-
-        all_allowed = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        one_blocked = {
-            "gptbot": "disallow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        all_allowed_score = _calculate_geo_score(parsed, all_allowed, [])
-        one_blocked_score = _calculate_geo_score(parsed, one_blocked, [])
+        all_allowed_score = _calculate_geo_score(_EMPTY_PARSED, _ALL_ALLOWED, [])
+        one_blocked_score = _calculate_geo_score(_EMPTY_PARSED, _ONE_BLOCKED, [])
 
-        assert one_blocked_score["breakdown"]["accessibility"]["score"] < all_allowed_score["breakdown"]["accessibility"]["score"]
+        assert _accessibility(one_blocked_score) < _accessibility(all_allowed_score)
 
     def test_noindex_severely_impacts_score(self):
         """noindex should have significant negative impact."""
-        parsed = {
-            "content_surface_size": {"components": {}},
-            "stats": {},
-            "schema_org": {"available": False},
-            "readability": {"available": False},
-            "quotable_sentences": [],
-            "content": {"headings": [], "paragraphs": []},
-        }
-
-        without_noindex = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        with_noindex = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": True, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        without_score = _calculate_geo_score(parsed, without_noindex, [])
-        with_score = _calculate_geo_score(parsed, with_noindex, [])
+        without_score = _calculate_geo_score(_EMPTY_PARSED, _ALL_ALLOWED, [])
+        with_score = _calculate_geo_score(_EMPTY_PARSED, _NOINDEX_ACCESS, [])
 
         # noindex should cost at least 10 points
         assert without_score["total"] - with_score["total"] >= 10
 
 
+# Golden values (update if algorithm changes intentionally)
+GOLDEN_MINIMAL = {
+    "total": 48,
+    "grade": "D",
+    "breakdown": {
+        # Accessibility: 40 (all allowed)
+        "accessibility": 40,
+        "structure": 0,
+        # Quality gets base points: 3 (readability default) + content_ratio +
+        # pronoun_clarity defaults = 8
+        "quality": 8,
+    },
+}
+GOLDEN_WELL_STRUCTURED = {
+    "total": 88,
+    "grade": "B",
+    "breakdown": {
+        # Accessibility: 40 (all allowed)
+        "accessibility": 40,
+        # Structure: 8 (5 headings) + 7 (2 lists) + 8 (schema) + 2 (breadcrumb) = 25
+        "structure": 25,
+        # Quality: readability, entities, definitions, content ratio, quotable
+        "quality": 23,
+    },
+}
+
+
+def _extract_golden(result: dict) -> dict:
+    """Project a score result onto the keys pinned by the golden values."""
+    return {
+        "total": result["total"],
+        "grade": result["grade"],
+        "breakdown": {
+            "accessibility": _accessibility(result),
+            "structure": _structure(result),
+            "quality": _quality(result),
+        },
+    }
+
+
 class TestGoldenScores:
     """
     Golden score tests - specific inputs with exact expected outputs.
@@ -298,34 +264,9 @@ class TestGoldenScores:
 
     def test_golden_minimal_content(self):
         """Minimal content should produce predictable low score."""
-        parsed = {
-            "content_surface_size": {"components": {}},
-            "stats": {},
-            "schema_org": {"available": False},
-            "readability": {"available": False},
-            "quotable_sentences": [],
-            "entities": [],
-            "content": {"headings": [], "paragraphs": []},
-        }
-        ai_access = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
+        result = _calculate_geo_score(_EMPTY_PARSED, _ALL_ALLOWED, [])
 
-        result = _calculate_geo_score(parsed, ai_access, [])
-
-        # Golden values (update if algorithm changes intentionally)
-        assert result["breakdown"]["accessibility"]["score"] == 40
-        assert result["breakdown"]["structure"]["score"] == 0
-        # Quality gets base points: 3 (readability default) + content_ratio + pronoun_clarity defaults
-        # Actual value is 8 based on current algorithm
-        assert result["breakdown"]["quality"]["score"] == 8
-        assert result["total"] == 48
-        assert result["grade"] == "D"
+        assert _extract_golden(result) == GOLDEN_MINIMAL
 
     def test_golden_well_structured(self):
         """Well-structured content should produce predictable good score."""
@@ -344,33 +285,11 @@ class TestGoldenScores:
                 "has_breadcrumb": True,
             },
             "readability": {"available": True, "flesch_reading_ease": 65},
-            "quotable_sentences": [
-                {"type": "statistic"},
-                {"type": "citation"},
-            ],
-            "entities": [{"name": f"entity{i}"} for i in range(5)],
+            "quotable_sentences": _STATISTIC_AND_CITATION,
+            "entities": _FIVE_ENTITIES,
             "content": {"headings": [], "paragraphs": []},
         }
-        ai_access = {
-            "gptbot": "allow",
-            "claudebot": "allow",
-            "perplexitybot": "allow",
-            "google_extended": "allow",
-            "meta_robots": {"noindex": False, "nofollow": False},
-            "x_robots_tag": {"noindex": False, "nofollow": False},
-        }
-
-        result = _calculate_geo_score(parsed, ai_access, [])
-
-        # Expected breakdown (update if algorithm changes)
-        # Accessibility: 40 (all allowed)
-        assert result["breakdown"]["accessibility"]["score"] == 40
-
-        # Structure: 8 (5 headings) + 7 (2 lists) + 8 (schema) + 2 (breadcrumb) = 25
-        assert result["breakdown"]["structure"]["score"] >= 20
 
-        # Quality: 6 (readability) + 3 (5 entities) + 4 (2 definitions) + 4 (content ratio) + 4 (quotable) = 21+
-        assert result["breakdown"]["quality"]["score"] >= 15
+        result = _calculate_geo_score(parsed, _ALL_ALLOWED, [])
 
-        # Total should be B grade
-        assert result["grade"] in ("A", "B")
+        assert _extract_golden(result) == GOLDEN_WELL_STRUCTURED
@@ -0,0 +1,42 @@
+"""Unit test fixtures shared across fetcher and URL guard tests."""
+from __future__ import annotations
+
+import socket
+from collections.abc import Callable
+
+import pytest
+
+
+def _addrinfo_for(ip_str: str, port: int = 443):
+    if ":" in ip_str:
+        return [
+            (
+                socket.AF_INET6,
+                socket.SOCK_STREAM,
+                6,
+                "",
+                (ip_str, port, 0, 0),
+            )
+        ]
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip_str, port))]
+
+
+@pytest.fixture
+def fake_dns(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Resolve hostnames to fixed IPs: ``fake_dns("93.184.216.34", {"db": "10.0.0.5"})``.
+
+    The first argument answers every host not listed in the optional
+    per-host overrides.
+    """
+
+    def _resolve_to(ip_str: str, overrides: dict[str, str] | None = None) -> None:
+        # Build the answers once; every lookup in the test reuses them
+        default = _addrinfo_for(ip_str)
+        by_host = {host: _addrinfo_for(ip) for host, ip in (overrides or {}).items()}
+        monkeypatch.setattr(
+            socket,
+            "getaddrinfo",
+            lambda host, *args, **kwargs: by_host.get(host, default),
+        )
+
+    return _resolve_to
@@ -1,74 +1,66 @@
 """Unit tests for content parser module."""
 from __future__ import annotations
 
+import pytest
 
-class TestDefinitionDetection:
-    """Tests for definition paragraph detection."""
-
-    def test_english_is_defined_pattern(self):
-        """English 'is defined as' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("AI is defined as artificial intelligence.")
-
-    def test_english_refers_to_pattern(self):
-        """English 'refers to' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("Machine learning refers to a type of AI.")
+from src.geo.geo_checker import _assess_link_quality
+from src.parser.content_parser import (
+    _detect_quotable_sentences,
+    _is_definition_paragraph,
+    parse_content,
+)
 
-    def test_english_means_pattern(self):
-        """English 'means' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("GEO means Generative Engine Optimization.")
 
-    def test_chinese_is_pattern(self):
-        """Chinese '是' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("機器學習是人工智慧的一種。")
-
-    def test_chinese_refers_to_pattern(self):
-        """Chinese '指的是' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("GEO 指的是生成式搜尋優化。")
-
-    def test_japanese_pattern(self):
-        """Japanese 'とは' pattern."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert _is_definition_paragraph("機械学習とは、AIの一種です。")
+class TestDefinitionDetection:
+    """Tests for definition paragraph detection."""
 
-    def test_non_definition(self):
-        """Non-definition text should return False."""
-        from src.parser.content_parser import _is_definition_paragraph
-        assert not _is_definition_paragraph("The weather is nice today.")
-        assert not _is_definition_paragraph("I went to the store.")
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("AI is defined as artificial intelligence.", True),
+            ("Machine learning refers to a type of AI.", True),
+            ("GEO means Generative Engine Optimization.", True),
+            ("機器學習是人工智慧的一種。", True),
+            ("GEO 指的是生成式搜尋優化。", True),
+            ("機械学習とは、AIの一種です。", True),
+            ("The weather is nice today.", False),
+            ("I went to the store.", False),
+        ],
+        ids=[
+            "en_defined_as",
+            "en_refers_to",
+            "en_means",
+            "zh_is",
+            "zh_refers_to",
+            "ja_towa",
+            "non_definition_weather",
+            "non_definition_store",
+        ],
+    )
+    def test_is_definition_paragraph(self, text, expected):
+        """Definition patterns are detected across languages; plain text is not."""
+        assert _is_definition_paragraph(text) is expected
 
 
 class TestQuotableSentences:
     """Tests for quotable sentence detection."""
 
-    def test_detect_statistic(self):
-        """Detect sentences with statistics."""
-        from src.parser.content_parser import _detect_quotable_sentences
-        text = "According to a 2024 study, 85% of users prefer AI search."
-        result = _detect_quotable_sentences(text)
-        assert len(result) >= 1
-
-    def test_detect_percentage(self):
-        """Detect sentences with percentages."""
-        from src.parser.content_parser import _detect_quotable_sentences
-        text = "The adoption rate increased by 50% in 2024."
-        result = _detect_quotable_sentences(text)
-        assert len(result) >= 1
-
-    def test_detect_citation(self):
-        """Detect sentences with citations."""
-        from src.parser.content_parser import _detect_quotable_sentences
-        text = "According to Smith et al., this is significant."
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "According to a 2024 study, 85% of users prefer AI search.",
+            "The adoption rate increased by 50% in 2024.",
+            "According to Smith et al., this is significant.",
+        ],
+        ids=["statistic", "percentage", "citation"],
+    )
+    def test_detect_quotable(self, text):
+        """Detect sentences with statistics, percentages and citations."""
         result = _detect_quotable_sentences(text)
         assert len(result) >= 1
 
     def test_no_quotable_content(self):
         """Text without quotable content."""
-        from src.parser.content_parser import _detect_quotable_sentences
         text = "This is a simple sentence without any special content."
         result = _detect_quotable_sentences(text)
         # May or may not detect, depends on heuristics
@@ -78,67 +70,49 @@ class TestQuotableSentences:
 class TestContentParsing:
     """Tests for main content parsing function."""
 
-    def test_parse_returns_expected_keys(self, valid_html: str, mock_url: str):
+    def test_parse_returns_expected_keys(self, parsed_content: dict):
         """parse_content should return expected keys."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-
         expected_keys = ["meta", "content", "stats"]
         for key in expected_keys:
-            assert key in result, f"Missing key: {key}"
+            assert key in parsed_content, f"Missing key: {key}"
 
-    def test_parse_extracts_title(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_title(self, parsed_content: dict):
         """Title should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        assert result["meta"]["title"] == "Test Page - GEO Checker Example"
+        assert parsed_content["meta"]["title"] == "Test Page - GEO Checker Example"
 
-    def test_parse_extracts_description(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_description(self, parsed_content: dict):
         """Description should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        assert "test page" in result["meta"]["description"].lower()
+        assert "test page" in parsed_content["meta"]["description"].lower()
 
-    def test_parse_extracts_headings(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_headings(self, parsed_content: dict):
         """Headings should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        headings = result["content"]["headings"]
+        headings = parsed_content["content"]["headings"]
         assert len(headings) > 0
         assert any(h["level"] == "h1" for h in headings)
 
-    def test_parse_extracts_paragraphs(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_paragraphs(self, parsed_content: dict):
         """Paragraphs should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        paragraphs = result["content"]["paragraphs"]
+        paragraphs = parsed_content["content"]["paragraphs"]
         assert len(paragraphs) > 0
 
-    def test_parse_extracts_lists(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_lists(self, parsed_content: dict):
         """Lists should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        lists = result["content"]["lists"]
+        lists = parsed_content["content"]["lists"]
         assert len(lists) > 0
 
-    def test_parse_extracts_canonical(self, valid_html: str, mock_url: str):
+    def test_parse_extracts_canonical(self, parsed_content: dict):
         """Canonical URL should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        assert result["meta"]["canonical"] == "https://example.com/test-page"
+        assert parsed_content["meta"]["canonical"] == "https://example.com/test-page"
 
-    def test_parse_calculates_stats(self, valid_html: str, mock_url: str):
+    def test_parse_calculates_stats(self, parsed_content: dict):
         """Stats should be calculated."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        stats = result["stats"]
+        stats = parsed_content["stats"]
         assert "word_count" in stats
         assert "heading_count" in stats
         assert stats["word_count"] > 0
 
     def test_parse_minimal_html(self, minimal_html: str, mock_url: str):
         """Minimal HTML should parse without errors."""
-        from src.parser.content_parser import parse_content
         result = parse_content(minimal_html, mock_url)
         assert result["meta"]["title"] == "Minimal"
 
@@ -146,19 +120,15 @@ class TestContentParsing:
 class TestLinkExtraction:
     """Tests for link extraction."""
 
-    def test_extract_internal_links(self, valid_html: str, mock_url: str):
+    def test_extract_internal_links(self, parsed_content: dict):
         """Internal links should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        links = result.get("links", {})
+        links = parsed_content.get("links", {})
         internal = links.get("internal", [])
         assert len(internal) > 0
 
-    def test_extract_external_links(self, valid_html: str, mock_url: str):
+    def test_extract_external_links(self, parsed_content: dict):
         """External links should be extracted."""
-        from src.parser.content_parser import parse_content
-        result = parse_content(valid_html, mock_url)
-        links = result.get("links", {})
+        links = parsed_content.get("links", {})
         external = links.get("external", [])
         assert len(external) > 0
 
@@ -174,7 +144,6 @@ class TestParserCheckerContract:
 
     def test_links_at_top_level(self, valid_html: str, mock_url: str):
         """parse_content() must put links at top level, not nested under content."""
-        from src.parser.content_parser import parse_content
         result = parse_content(valid_html, mock_url)
         assert "links" in result, "links must be a top-level key"
         assert "links" not in result.get("content", {}), \
@@ -184,7 +153,6 @@ class TestParserCheckerContract:
         self, valid_html: str, mock_url: str
     ):
         """parsed['links'] must be a dict with 'internal' and 'external' lists."""
-        from src.parser.content_parser import parse_content
         result = parse_content(valid_html, mock_url)
         links = result["links"]
         assert isinstance(links, dict), "parsed['links'] must be a dict, not a list"
@@ -196,7 +164,6 @@ class TestParserCheckerContract:
         self, valid_html: str, mock_url: str
     ):
         """Each link entry must be a dict with at least 'href' and 'text' keys."""
-        from src.parser.content_parser import parse_content
         result = parse_content(valid_html, mock_url)
         all_links = result["links"]["internal"] + result["links"]["external"]
         assert len(all_links) > 0, "fixture should produce at least one link"
@@ -211,8 +178,6 @@ class TestParserCheckerContract:
         This is the regression guard. Before the fix, total_links was always 0
         because the consumer read the wrong path.
         """
-        from src.geo.geo_checker import _assess_link_quality
-        from src.parser.content_parser import parse_content
         parsed = parse_content(valid_html, mock_url)
         link_quality = _assess_link_quality(parsed)
         assert link_quality["total_links"] > 0, \
@@ -224,7 +189,6 @@ class TestSchemaOrgExtraction:
 
     def test_no_schema_handling(self, minimal_html: str, mock_url: str):
         """Pages without Schema.org should be handled."""
-        from src.parser.content_parser import parse_content
         result = parse_content(minimal_html, mock_url)
         schema = result.get("schema_org", {})
         assert (
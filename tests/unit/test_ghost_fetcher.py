@@ -1,10 +1,12 @@
 """Unit tests for Ghost Admin API fetcher."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
+import jwt
 import pytest
 
+from src.config.settings import FetcherSettings, GhostSettings
 from src.fetcher.ghost_fetcher import (
     GhostAPIError,
     _build_html_document,
@@ -14,19 +16,53 @@ from src.fetcher.ghost_fetcher import (
     is_ghost_url,
 )
 
+pytestmark = pytest.mark.unit
 
-class TestParseGhostURL:
-    def test_simple_slug(self):
-        result = _parse_ghost_url("https://example.com/my-post/")
-        assert result == {"type": "slug", "value": "my-post"}
 
-    def test_no_trailing_slash(self):
-        result = _parse_ghost_url("https://example.com/my-post")
-        assert result == {"type": "slug", "value": "my-post"}
+# id:secret Admin API key; 64 hex chars = 32 bytes secret
+_VALID_API_KEY = "abc123:" + "a" * 64
+# Admin API base for _CONFIGURED_SETTINGS
+_ADMIN_API = "https://ghost.example.com/ghost/api/admin"
+
+# Settings stand-ins built once from the real config dataclasses and never
+# mutated; tests pick one through the fixtures below
+_CONFIGURED_SETTINGS = SimpleNamespace(
+    ghost=GhostSettings(url="https://ghost.example.com", admin_api_key=_VALID_API_KEY),
+    fetcher=FetcherSettings(),
+)
+_UNCONFIGURED_SETTINGS = SimpleNamespace(ghost=GhostSettings(), fetcher=FetcherSettings())
+
+
+@pytest.fixture(autouse=True)
+def ghost_settings(monkeypatch) -> None:
+    """Point the fetcher at a configured Ghost instance."""
+    monkeypatch.setattr("src.fetcher.ghost_fetcher.settings", _CONFIGURED_SETTINGS)
+
+
+@pytest.fixture
+def unconfigured_ghost(monkeypatch) -> None:
+    """Clear GHOST_URL / GHOST_ADMIN_API_KEY for the test."""
+    monkeypatch.setattr("src.fetcher.ghost_fetcher.settings", _UNCONFIGURED_SETTINGS)
+
+
+@pytest.fixture(scope="session")
+def ghost_jwt() -> str:
+    """Sign the test Admin API key once per session."""
+    return _create_ghost_jwt(_VALID_API_KEY)
+
 
-    def test_nested_path(self):
-        result = _parse_ghost_url("https://example.com/blog/my-post/")
-        assert result == {"type": "slug", "value": "my-post"}
+class TestParseGhostURL:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://example.com/my-post/",
+            "https://example.com/my-post",
+            "https://example.com/blog/my-post/",
+        ],
+        ids=["simple_slug", "no_trailing_slash", "nested_path"],
+    )
+    def test_slug(self, url):
+        assert _parse_ghost_url(url) == {"type": "slug", "value": "my-post"}
 
     def test_editor_url_with_post_id(self):
         result = _parse_ghost_url(
@@ -40,175 +76,153 @@ class TestParseGhostURL:
 
 
 class TestIsGhostURL:
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_matching_domain(self, mock_settings):
-        mock_settings.ghost.url = "https://marketing.91app.com"
-        assert is_ghost_url("https://marketing.91app.com/some-post/") is True
-
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_non_matching_domain(self, mock_settings):
-        mock_settings.ghost.url = "https://marketing.91app.com"
+    def test_matching_domain(self):
+        assert is_ghost_url("https://ghost.example.com/some-post/") is True
+
+    def test_non_matching_domain(self):
         assert is_ghost_url("https://example.com/page") is False
 
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_no_ghost_configured(self, mock_settings):
-        mock_settings.ghost.url = ""
-        assert is_ghost_url("https://marketing.91app.com/post/") is False
+    def test_no_ghost_configured(self, unconfigured_ghost):
+        assert is_ghost_url("https://ghost.example.com/post/") is False
 
 
 class TestCreateJWT:
-    def test_jwt_has_three_parts(self):
-        # 64 hex chars = 32 bytes secret
-        api_key = "abc123:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-        token = _create_ghost_jwt(api_key)
-        assert len(token.split(".")) == 3
+    def test_jwt_has_three_parts(self, ghost_jwt):
+        assert len(ghost_jwt.split(".")) == 3
+
+    @pytest.mark.parametrize(
+        "claim,expected", [("alg", "HS256"), ("typ", "JWT"), ("kid", "abc123")]
+    )
+    def test_header(self, ghost_jwt, claim, expected):
+        assert jwt.get_unverified_header(ghost_jwt)[claim] == expected
+
+    def test_payload_audience_and_lifetime(self, ghost_jwt):
+        payload = jwt.decode(
+            ghost_jwt, bytes.fromhex("a" * 64), algorithms=["HS256"], audience="/admin/"
+        )
+        assert payload["exp"] - payload["iat"] == 5 * 60
 
-    def test_invalid_key_format_raises(self):
+    @pytest.mark.parametrize("api_key", ["no-colon-here", "id:secret:extra"])
+    def test_invalid_key_format_raises(self, api_key):
         with pytest.raises(GhostAPIError, match="格式錯誤"):
-            _create_ghost_jwt("no-colon-here")
+            _create_ghost_jwt(api_key)
 
 
 class TestBuildHTMLDocument:
-    def test_basic_fields(self):
-        post = {
-            "title": "Test Post",
-            "html": "<p>Hello world</p>",
-            "meta_description": "A test",
-            "status": "draft",
-        }
-        html = _build_html_document(post, "https://example.com/test/")
-        assert "<title>Test Post</title>" in html
-        assert "Hello world" in html
-        assert 'content="A test"' in html
-        assert "noindex" in html
-
-    def test_published_status(self):
-        post = {"title": "Pub", "html": "<p>X</p>", "status": "published"}
-        html = _build_html_document(post, "https://example.com/pub/")
-        assert "index, follow" in html
-
-    def test_fallback_description(self):
-        post = {"title": "T", "html": "", "custom_excerpt": "Excerpt here", "status": "draft"}
-        html = _build_html_document(post, "https://example.com/t/")
-        assert "Excerpt here" in html
-
-    def test_html_escaping_in_title(self):
-        post = {"title": 'A "B" & <C>', "html": "", "status": "draft"}
-        html = _build_html_document(post, "https://example.com/x/")
-        assert "&amp;" in html
-        assert "&lt;" in html
-        assert "&quot;" in html
-
-    def test_schema_org_present(self):
-        post = {"title": "Schema Test", "html": "<p>Body</p>", "status": "draft"}
-        html = _build_html_document(post, "https://example.com/s/")
-        assert "application/ld+json" in html
-        assert "BlogPosting" in html
-
-    def test_canonical_from_post(self):
-        post = {
-            "title": "T",
-            "html": "",
-            "status": "draft",
-            "canonical_url": "https://custom.com/canonical",
-        }
-        html = _build_html_document(post, "https://example.com/t/")
-        assert "https://custom.com/canonical" in html
-
-    def test_og_image(self):
-        post = {
-            "title": "T",
-            "html": "",
-            "status": "draft",
-            "feature_image": "https://img.example.com/photo.jpg",
-        }
-        html = _build_html_document(post, "https://example.com/t/")
-        assert "og:image" in html
-        assert "photo.jpg" in html
+    @pytest.mark.parametrize(
+        "post,url,needles",
+        [
+            (
+                {
+                    "title": "Test Post",
+                    "html": "<p>Hello world</p>",
+                    "meta_description": "A test",
+                    "status": "draft",
+                },
+                "https://example.com/test/",
+                ("<title>Test Post</title>", "Hello world", 'content="A test"', "noindex"),
+            ),
+            (
+                {"title": "Pub", "html": "<p>X</p>", "status": "published"},
+                "https://example.com/pub/",
+                ("index, follow",),
+            ),
+            (
+                {"title": "T", "html": "", "custom_excerpt": "Excerpt here", "status": "draft"},
+                "https://example.com/t/",
+                ("Excerpt here",),
+            ),
+            (
+                {"title": 'A "B" & <C>', "html": "", "status": "draft"},
+                "https://example.com/x/",
+                ("&amp;", "&lt;", "&quot;"),
+            ),
+            (
+                {"title": "Schema Test", "html": "<p>Body</p>", "status": "draft"},
+                "https://example.com/s/",
+                ("application/ld+json", "BlogPosting"),
+            ),
+            (
+                {
+                    "title": "T",
+                    "html": "",
+                    "status": "draft",
+                    "canonical_url": "https://custom.com/canonical",
+                },
+                "https://example.com/t/",
+                ("https://custom.com/canonical",),
+            ),
+            (
+                {
+                    "title": "T",
+                    "html": "",
+                    "status": "draft",
+                    "feature_image": "https://img.example.com/photo.jpg",
+                },
+                "https://example.com/t/",
+                ("og:image", "photo.jpg"),
+            ),
+        ],
+        ids=[
+            "basic_fields", "published_status", "fallback_description",
+            "html_escaping_in_title", "schema_org_present", "canonical_from_post", "og_image",
+        ],
+    )
+    def test_build_html(self, post, url, needles):
+        html = _build_html_document(post, url)
+        for needle in needles:
+            assert needle in html
 
 
 class TestFetchGhostPost:
-    @patch("src.fetcher.ghost_fetcher.requests.get")
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_successful_fetch(self, mock_settings, mock_get):
-        mock_settings.ghost.url = "https://ghost.example.com"
-        mock_settings.ghost.admin_api_key = "abc123:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-        mock_settings.fetcher.request_timeout = 15
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+    @pytest.fixture(autouse=True)
+    def _reuse_jwt(self, monkeypatch, ghost_jwt):
+        """Skip per-test signing; fetch only forwards the token."""
+        monkeypatch.setattr(
+            "src.fetcher.ghost_fetcher._create_ghost_jwt", lambda _api_key: ghost_jwt
+        )
+
+    def test_successful_fetch(self, requests_mock):
+        requests_mock.get(f"{_ADMIN_API}/posts/slug/draft-post/", json={
             "posts": [{
                 "title": "Draft Post",
                 "html": "<p>Draft content</p>",
                 "meta_description": "Draft desc",
                 "status": "draft",
             }]
-        }
-        mock_get.return_value = mock_response
+        })
 
         html = fetch_ghost_post("https://ghost.example.com/draft-post/")
         assert "Draft Post" in html
         assert "Draft content" in html
 
-    @patch("src.fetcher.ghost_fetcher.requests.get")
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_404_raises(self, mock_settings, mock_get):
-        mock_settings.ghost.url = "https://ghost.example.com"
-        mock_settings.ghost.admin_api_key = "abc123:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-        mock_settings.fetcher.request_timeout = 15
-
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+    def test_404_raises(self, requests_mock):
+        requests_mock.get(f"{_ADMIN_API}/posts/slug/missing/", status_code=404)
 
         with pytest.raises(GhostAPIError, match="不存在"):
             fetch_ghost_post("https://ghost.example.com/missing/")
 
-    @patch("src.fetcher.ghost_fetcher.requests.get")
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_401_raises(self, mock_settings, mock_get):
-        mock_settings.ghost.url = "https://ghost.example.com"
-        mock_settings.ghost.admin_api_key = "abc123:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-        mock_settings.fetcher.request_timeout = 15
-
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
+    def test_401_raises(self, requests_mock):
+        requests_mock.get(f"{_ADMIN_API}/posts/slug/post/", status_code=401)
 
         with pytest.raises(GhostAPIError, match="驗證失敗"):
             fetch_ghost_post("https://ghost.example.com/post/")
 
-    @patch("src.fetcher.ghost_fetcher.requests.get")
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_editor_url_uses_id_endpoint(self, mock_settings, mock_get):
-        mock_settings.ghost.url = "https://ghost.example.com"
-        mock_settings.ghost.admin_api_key = "abc123:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-        mock_settings.fetcher.request_timeout = 15
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+    def test_editor_url_uses_id_endpoint(self, requests_mock, ghost_jwt):
+        # Only the ID endpoint is registered; a slug lookup would fail to match
+        requests_mock.get(f"{_ADMIN_API}/posts/69841ab925a6de00018d60d0/", json={
             "posts": [{
                 "title": "Editor Post",
                 "html": "<p>Editor content</p>",
                 "status": "draft",
             }]
-        }
-        mock_get.return_value = mock_response
+        })
 
         html = fetch_ghost_post("https://ghost.example.com/ghost/#/editor/post/69841ab925a6de00018d60d0")
         assert "Editor Post" in html
+        assert requests_mock.last_request.qs == {"formats": ["html"]}
+        assert requests_mock.last_request.headers["Authorization"] == f"Ghost {ghost_jwt}"
 
-        # Verify the API was called with the ID endpoint, not slug
-        call_url = mock_get.call_args[0][0]
-        assert "/posts/69841ab925a6de00018d60d0/" in call_url
-        assert "/slug/" not in call_url
-
-    @patch("src.fetcher.ghost_fetcher.settings")
-    def test_not_configured_raises(self, mock_settings):
-        mock_settings.ghost.url = ""
-        mock_settings.ghost.admin_api_key = ""
-
+    def test_not_configured_raises(self, unconfigured_ghost):
         with pytest.raises(GhostAPIError, match="未設定"):
             fetch_ghost_post("https://ghost.example.com/post/")
@@ -11,56 +11,15 @@ those.
 """
 from __future__ import annotations
 
-from src.fetcher.html_fetcher import _is_url, _needs_js_render
-
-
-class TestURLValidation:
-    """Tests for URL scheme validation."""
-
-    def test_valid_http_url(self):
-        assert _is_url("http://example.com") is True
-
-    def test_valid_https_url(self):
-        assert _is_url("https://example.com") is True
-
-    def test_invalid_file_scheme(self):
-        assert _is_url("file:///etc/passwd") is False
-
-    def test_invalid_no_scheme(self):
-        assert _is_url("example.com") is False
-
-    def test_invalid_javascript_scheme(self):
-        assert _is_url("javascript:alert(1)") is False
-
-    def test_invalid_data_scheme(self):
-        assert _is_url("data:text/html,<script>alert(1)</script>") is False
-
-    def test_invalid_ftp_scheme(self):
-        assert _is_url("ftp://files.example.com/file.txt") is False
-
-
-class TestJSRenderDetection:
-    """Tests for JavaScript render detection heuristics."""
+import pytest
 
-    def test_js_required_message_triggers_render(self):
-        """Pages with 'JavaScript must be enabled' should trigger JS render."""
-        html = "<html><body>JavaScript must be enabled to view this page</body></html>"
-        assert _needs_js_render(html, "text/html") is True
-
-    def test_non_html_content_type_triggers_render(self):
-        """Non-HTML content type should trigger JS render."""
-        html = "<html><body>Content</body></html>"
-        assert _needs_js_render(html, "application/json") is True
+from src.fetcher.html_fetcher import _is_url, _needs_js_render
 
-    def test_short_html_without_content_triggers_render(self):
-        """Short HTML without paragraphs or headings should trigger JS render."""
-        html = "<html><body><div id='app'></div></body></html>"
-        assert _needs_js_render(html, "text/html") is True
+pytestmark = pytest.mark.unit
 
-    def test_normal_html_does_not_trigger_render(self):
-        """Normal HTML with real content should not trigger JS render."""
-        html = (
-            """
+# Server-rendered page long enough to clear the short-HTML heuristic
+_LONG_HTML = (
+    """
         <html>
         <head><title>Test</title></head>
         <body>
@@ -70,6 +29,52 @@ class TestJSRenderDetection:
         </body>
         </html>
         """
-            * 10
-        )
-        assert _needs_js_render(html, "text/html") is False
+    * 10
+)
+
+
+class TestURLValidation:
+    """Tests for URL scheme validation."""
+
+    @pytest.mark.parametrize("url", ["http://example.com", "https://example.com"])
+    def test_valid_url(self, url):
+        assert _is_url(url) is True
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "file:///etc/passwd",
+            "example.com",
+            "javascript:alert(1)",
+            "data:text/html,<script>alert(1)</script>",
+            "ftp://files.example.com/file.txt",
+        ],
+        ids=["file", "no_scheme", "javascript", "data", "ftp"],
+    )
+    def test_invalid_url(self, url):
+        assert _is_url(url) is False
+
+
+class TestJSRenderDetection:
+    """Tests for JavaScript render detection heuristics."""
+
+    @pytest.mark.parametrize(
+        "html,content_type,expected",
+        [
+            # 'JavaScript must be enabled' message
+            (
+                "<html><body>JavaScript must be enabled to view this page</body></html>",
+                "text/html",
+                True,
+            ),
+            # Non-HTML content type
+            ("<html><body>Content</body></html>", "application/json", True),
+            # Short HTML without paragraphs or headings
+            ("<html><body><div id='app'></div></body></html>", "text/html", True),
+            # Normal HTML with real content
+            (_LONG_HTML, "text/html", False),
+        ],
+        ids=["js_required_message", "non_html_content_type", "short_empty_shell", "normal_html"],
+    )
+    def test_needs_js_render(self, html, content_type, expected):
+        assert _needs_js_render(html, content_type) is expected
@@ -1,7 +1,8 @@
 """Tests for the live Perplexity probe helper."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from src.ai.live_probe import (
     _extract_domain,
@@ -10,6 +11,11 @@ from src.ai.live_probe import (
 )
 
 
+def _response(status_code: int, payload: dict | None = None) -> SimpleNamespace:
+    """Minimal stand-in for requests.Response: probe_perplexity reads only these."""
+    return SimpleNamespace(status_code=status_code, json=lambda: payload)
+
+
 def test_generate_probe_queries_from_title() -> None:
     parsed = {
         "meta": {"title": "Example GEO Page"},
@@ -75,12 +81,10 @@ def test_generate_probe_queries_dedupe() -> None:
 
 
 def test_probe_perplexity_success() -> None:
-    response = MagicMock()
-    response.status_code = 200
-    response.json.return_value = {
+    response = _response(200, {
         "choices": [{"message": {"content": "Example answer"}}],
         "citations": [{"url": "https://docs.example.com", "title": "Docs"}],
-    }
+    })
 
     with patch("src.ai.live_probe.requests.post", return_value=response) as mock_post:
         result = probe_perplexity(
@@ -100,9 +104,7 @@ def test_probe_perplexity_success() -> None:
 
 
 def test_probe_perplexity_cites_target() -> None:
-    response = MagicMock()
-    response.status_code = 200
-    response.json.return_value = {
+    response = _response(200, {
         "choices": [{"message": {"content": "Answer with citation"}}],
         "citations": [
             {
@@ -111,7 +113,7 @@ def test_probe_perplexity_cites_target() -> None:
                 "snippet": "Matched snippet",
             }
         ],
-    }
+    })
 
     with patch("src.ai.live_probe.requests.post", return_value=response):
         result = probe_perplexity("https://example.com/article", ["What is GEO?"], "pplx-test")
@@ -123,12 +125,10 @@ def test_probe_perplexity_cites_target() -> None:
 
 
 def test_probe_perplexity_no_citation() -> None:
-    response = MagicMock()
-    response.status_code = 200
-    response.json.return_value = {
+    response = _response(200, {
         "choices": [{"message": {"content": "Answer without target"}}],
         "citations": ["https://other.example.org/page"],
-    }
+    })
 
     with patch("src.ai.live_probe.requests.post", return_value=response):
         result = probe_perplexity("https://example.com/article", ["What is GEO?"], "pplx-test")
@@ -138,8 +138,7 @@ def test_probe_perplexity_no_citation() -> None:
 
 
 def test_probe_perplexity_401() -> None:
-    response = MagicMock()
-    response.status_code = 401
+    response = _response(401)
 
     with patch("src.ai.live_probe.requests.post", return_value=response):
         result = probe_perplexity("https://example.com/article", ["What is GEO?"], "pplx-test")
@@ -148,8 +147,7 @@ def test_probe_perplexity_401() -> None:
 
 
 def test_probe_perplexity_429() -> None:
-    response = MagicMock()
-    response.status_code = 429
+    response = _response(429)
 
     with patch("src.ai.live_probe.requests.post", return_value=response):
         result = probe_perplexity("https://example.com/article", ["What is GEO?"], "pplx-test")
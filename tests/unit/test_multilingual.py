@@ -18,6 +18,10 @@ from src.parser.content_parser import (
     parse_content,
 )
 
+# Keep this module on one xdist worker (--dist loadgroup) so the session-scoped
+# parsed_* documents are built once; other modules still shard across workers
+pytestmark = pytest.mark.xdist_group(name="multilingual")
+
 
 class TestLanguageDetection:
     """Tests for language detection."""
@@ -59,97 +63,63 @@ class TestLanguageDetection:
         assert lang == "zh"
 
 
-class TestDefinitionDetection:
-    """Tests for definition detection across languages."""
-
+# Definition-detection tables: (text,) rows with stable "<lang>-<pattern>" ids
+_DEFINITION_POSITIVES = (
     # English patterns - only patterns explicitly supported
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "AI is defined as artificial intelligence.",
-            "Machine learning refers to algorithms that learn from data.",
-            # Note: "is a subset of" and "is used to describe" are not supported patterns
-        ],
-    )
-    def test_english_definition_patterns(self, text):
-        """English definition patterns should be detected."""
-        assert _is_definition_paragraph(text) is True
+    # Note: "is a subset of" and "is used to describe" are not supported patterns
+    pytest.param("AI is defined as artificial intelligence.", id="en-defined-as"),
+    pytest.param(
+        "Machine learning refers to algorithms that learn from data.", id="en-refers-to"
+    ),
+    # Chinese Traditional patterns
+    pytest.param("機器學習是人工智慧的一種。", id="zh_hant-shi"),
+    pytest.param("深度學習指的是多層神經網路的學習方法。", id="zh_hant-zhideshi"),
+    pytest.param("人工智慧可以理解為模擬人類智慧的技術。", id="zh_hant-keyi-lijie-wei"),
+    pytest.param("GEO 係指生成式搜尋引擎優化。", id="zh_hant-xizhi"),
+    # Chinese Simplified patterns - only patterns with supported keywords
+    pytest.param("机器学习是人工智能的一种。", id="zh_hans-shi"),
+    pytest.param("深度学习指的是多层神经网络的学习方法。", id="zh_hans-zhideshi"),
+    # Japanese patterns
+    pytest.param("機械学習とは、コンピュータがデータから学習することです。", id="ja-towa"),
+    pytest.param("人工知能とは、人間の知能を模倣する技術である。", id="ja-towa-dearu"),
+    pytest.param("ディープラーニングを意味する深層学習は重要です。", id="ja-wo-imisuru"),
+)
 
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "Deep learning is a subset of machine learning.",  # "is a subset" not supported
-            "The term 'neural network' is used to describe connected nodes.",  # "is used to" not supported
-        ],
-    )
-    def test_english_unsupported_patterns(self, text):
-        """Some English patterns are not currently detected (known limitation)."""
-        # These patterns are reasonable definitions but not in current implementation
-        # This test documents the limitation
-        result = _is_definition_paragraph(text)
-        # May or may not be detected depending on implementation
-        assert isinstance(result, bool)
+# Reasonable definitions outside the current pattern set (known limitations)
+_DEFINITION_UNSUPPORTED = (
+    pytest.param("Deep learning is a subset of machine learning.", id="en-subset-of"),
+    pytest.param(
+        "The term 'neural network' is used to describe connected nodes.",
+        id="en-used-to-describe",
+    ),
+    # The "为" in simplified Chinese differs from "為" in traditional
+    pytest.param("人工智能可以理解为模拟人类智慧的技术。", id="zh_hans-keyi-lijie-wei"),
+)
 
-    # Chinese Traditional patterns
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "機器學習是人工智慧的一種。",
-            "深度學習指的是多層神經網路的學習方法。",
-            "人工智慧可以理解為模擬人類智慧的技術。",
-            "GEO 係指生成式搜尋引擎優化。",
-        ],
-    )
-    def test_chinese_traditional_definition_patterns(self, text):
-        """Traditional Chinese definition patterns should be detected."""
-        assert _is_definition_paragraph(text) is True
+_DEFINITION_NEGATIVES = (
+    pytest.param("The weather is nice today. I went shopping yesterday.", id="en"),
+    pytest.param("今天天氣很好。我昨天去購物了。", id="zh_hant"),
+    pytest.param("今日は天気がいいです。昨日買い物に行きました。", id="ja"),
+)
 
-    # Chinese Simplified patterns - only patterns with supported keywords
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "机器学习是人工智能的一种。",  # "是" pattern
-            "深度学习指的是多层神经网络的学习方法。",  # "指的是" pattern
-            # Note: "可以理解为" uses simplified "为" which differs from traditional "為"
-        ],
-    )
-    def test_chinese_simplified_definition_patterns(self, text):
-        """Simplified Chinese definition patterns should be detected."""
-        assert _is_definition_paragraph(text) is True
 
-    def test_chinese_simplified_unsupported_pattern(self):
-        """Some simplified Chinese patterns may not be detected (known limitation)."""
-        text = "人工智能可以理解为模拟人类智慧的技术。"
-        # The "为" in simplified Chinese differs from "為" in traditional
-        result = _is_definition_paragraph(text)
-        assert isinstance(result, bool)
+class TestDefinitionDetection:
+    """Tests for definition detection across languages."""
 
-    # Japanese patterns
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "機械学習とは、コンピュータがデータから学習することです。",
-            "人工知能とは、人間の知能を模倣する技術である。",
-            "ディープラーニングを意味する深層学習は重要です。",
-        ],
-    )
-    def test_japanese_definition_patterns(self, text):
-        """Japanese definition patterns should be detected."""
+    @pytest.mark.parametrize("text", _DEFINITION_POSITIVES)
+    def test_definition_patterns(self, text):
+        """Supported definition patterns should be detected."""
         assert _is_definition_paragraph(text) is True
 
-    def test_non_definition_english(self):
-        """Non-definition English text should not be detected."""
-        text = "The weather is nice today. I went shopping yesterday."
-        assert _is_definition_paragraph(text) is False
-
-    def test_non_definition_chinese(self):
-        """Non-definition Chinese text should not be detected."""
-        text = "今天天氣很好。我昨天去購物了。"
-        assert _is_definition_paragraph(text) is False
+    @pytest.mark.parametrize("text", _DEFINITION_UNSUPPORTED)
+    def test_unsupported_patterns(self, text):
+        """Some definition patterns are not currently detected (known limitation)."""
+        # May or may not be detected depending on implementation
+        assert isinstance(_is_definition_paragraph(text), bool)
 
-    def test_non_definition_japanese(self):
-        """Non-definition Japanese text should not be detected."""
-        text = "今日は天気がいいです。昨日買い物に行きました。"
+    @pytest.mark.parametrize("text", _DEFINITION_NEGATIVES)
+    def test_non_definition(self, text):
+        """Non-definition text should not be detected."""
         assert _is_definition_paragraph(text) is False
 
 
@@ -197,126 +167,199 @@ class TestCJKEntityExtraction:
         assert isinstance(entities, list)
 
 
+# Module-level documents, each parsed once per session by the fixtures below
+EN_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <title>Machine Learning Guide</title>
+    <meta name="description" content="Learn about machine learning fundamentals.">
+</head>
+<body>
+    <h1>Introduction to Machine Learning</h1>
+    <p>Machine learning is defined as a subset of artificial intelligence.</p>
+    <p>According to a 2024 study, 85% of enterprises use AI technology.</p>
+    <ul>
+        <li>Supervised learning</li>
+        <li>Unsupervised learning</li>
+    </ul>
+</body>
+</html>
+"""
+
+ZH_TW_HTML = """
+<!DOCTYPE html>
+<html lang="zh-TW">
+<head>
+    <title>機器學習入門指南</title>
+    <meta name="description" content="學習機器學習的基礎知識。">
+</head>
+<body>
+    <h1>機器學習簡介</h1>
+    <p>機器學習是人工智慧的一個重要分支。</p>
+    <p>根據 2024 年的研究，85% 的企業使用人工智慧技術。</p>
+    <h2>學習類型</h2>
+    <ul>
+        <li>監督式學習</li>
+        <li>非監督式學習</li>
+        <li>強化學習</li>
+    </ul>
+</body>
+</html>
+"""
+
+ZH_CN_HTML = """
+<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <title>机器学习入门指南</title>
+    <meta name="description" content="学习机器学习的基础知识。">
+</head>
+<body>
+    <h1>机器学习简介</h1>
+    <p>机器学习是人工智能的一个重要分支。</p>
+    <p>深度学习指的是多层神经网络的学习方法。</p>
+    <ul>
+        <li>监督学习</li>
+        <li>无监督学习</li>
+    </ul>
+</body>
+</html>
+"""
+
+JA_HTML = """
+<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <title>機械学習入門ガイド</title>
+    <meta name="description" content="機械学習の基礎を学ぶ。">
+</head>
+<body>
+    <h1>機械学習とは</h1>
+    <p>機械学習とは、コンピュータがデータから学習することを可能にする人工知能の一分野です。</p>
+    <p>2024年の調査によると、85%の企業がAI技術を使用しています。</p>
+    <h2>学習の種類</h2>
+    <ul>
+        <li>教師あり学習</li>
+        <li>教師なし学習</li>
+        <li>強化学習</li>
+    </ul>
+</body>
+</html>
+"""
+
+ZH_TW_SCHEMA_HTML = """
+<!DOCTYPE html>
+<html lang="zh-TW">
+<head>
+    <title>機器學習指南</title>
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": "機器學習完整指南",
+        "author": {"@type": "Person", "name": "張三"}
+    }
+    </script>
+</head>
+<body>
+    <h1>機器學習指南</h1>
+    <p>這是一篇關於機器學習的文章。</p>
+</body>
+</html>
+"""
+
+JA_FAQ_HTML = """
+<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <title>よくある質問</title>
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": [{
+            "@type": "Question",
+            "name": "機械学習とは何ですか？",
+            "acceptedAnswer": {
+                "@type": "Answer",
+                "text": "機械学習はAIの一分野です。"
+            }
+        }]
+    }
+    </script>
+</head>
+<body>
+    <h1>よくある質問</h1>
+    <h2>機械学習とは何ですか？</h2>
+    <p>機械学習はAIの一分野です。</p>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(scope="session")
+def parsed_en() -> dict:
+    return parse_content(EN_HTML, "https://example.com/ml-guide")
+
+
+@pytest.fixture(scope="session")
+def parsed_zh_tw() -> dict:
+    return parse_content(ZH_TW_HTML, "https://example.com/ml-guide-tw")
+
+
+@pytest.fixture(scope="session")
+def parsed_zh_cn() -> dict:
+    return parse_content(ZH_CN_HTML, "https://example.com/ml-guide-cn")
+
+
+@pytest.fixture(scope="session")
+def parsed_ja() -> dict:
+    return parse_content(JA_HTML, "https://example.com/ml-guide-ja")
+
+
+@pytest.fixture(scope="session")
+def parsed_zh_tw_schema() -> dict:
+    return parse_content(ZH_TW_SCHEMA_HTML, "https://example.com")
+
+
+@pytest.fixture(scope="session")
+def parsed_ja_faq() -> dict:
+    return parse_content(JA_FAQ_HTML, "https://example.com")
+
+
 class TestMultilingualParsing:
     """Integration tests for multilingual content parsing."""
 
-    def test_parse_english_content(self):
+    def test_parse_english_content(self, parsed_en):
         """English HTML should be parsed correctly."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <title>Machine Learning Guide</title>
-            <meta name="description" content="Learn about machine learning fundamentals.">
-        </head>
-        <body>
-            <h1>Introduction to Machine Learning</h1>
-            <p>Machine learning is defined as a subset of artificial intelligence.</p>
-            <p>According to a 2024 study, 85% of enterprises use AI technology.</p>
-            <ul>
-                <li>Supervised learning</li>
-                <li>Unsupervised learning</li>
-            </ul>
-        </body>
-        </html>
-        """
-        url = "https://example.com/ml-guide"
-        result = parse_content(html, url)
-
-        assert result["meta"]["title"] == "Machine Learning Guide"
-        assert len(result["content"]["headings"]) >= 1
-        assert len(result["content"]["paragraphs"]) >= 2
-        assert len(result["content"]["lists"]) >= 1
+        assert parsed_en["meta"]["title"] == "Machine Learning Guide"
+        assert len(parsed_en["content"]["headings"]) >= 1
+        assert len(parsed_en["content"]["paragraphs"]) >= 2
+        assert len(parsed_en["content"]["lists"]) >= 1
 
-    def test_parse_chinese_traditional_content(self):
+    def test_parse_chinese_traditional_content(self, parsed_zh_tw):
         """Traditional Chinese HTML should be parsed correctly."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="zh-TW">
-        <head>
-            <title>機器學習入門指南</title>
-            <meta name="description" content="學習機器學習的基礎知識。">
-        </head>
-        <body>
-            <h1>機器學習簡介</h1>
-            <p>機器學習是人工智慧的一個重要分支。</p>
-            <p>根據 2024 年的研究，85% 的企業使用人工智慧技術。</p>
-            <h2>學習類型</h2>
-            <ul>
-                <li>監督式學習</li>
-                <li>非監督式學習</li>
-                <li>強化學習</li>
-            </ul>
-        </body>
-        </html>
-        """
-        url = "https://example.com/ml-guide-tw"
-        result = parse_content(html, url)
-
-        assert result["meta"]["title"] == "機器學習入門指南"
-        assert len(result["content"]["headings"]) >= 2
-        assert len(result["content"]["paragraphs"]) >= 2
+        assert parsed_zh_tw["meta"]["title"] == "機器學習入門指南"
+        assert len(parsed_zh_tw["content"]["headings"]) >= 2
+        assert len(parsed_zh_tw["content"]["paragraphs"]) >= 2
         # Lists may or may not be extracted depending on HTML structure
-        lists = result["content"].get("lists", [])
+        lists = parsed_zh_tw["content"].get("lists", [])
         assert isinstance(lists, list)
 
-    def test_parse_chinese_simplified_content(self):
+    def test_parse_chinese_simplified_content(self, parsed_zh_cn):
         """Simplified Chinese HTML should be parsed correctly."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="zh-CN">
-        <head>
-            <title>机器学习入门指南</title>
-            <meta name="description" content="学习机器学习的基础知识。">
-        </head>
-        <body>
-            <h1>机器学习简介</h1>
-            <p>机器学习是人工智能的一个重要分支。</p>
-            <p>深度学习指的是多层神经网络的学习方法。</p>
-            <ul>
-                <li>监督学习</li>
-                <li>无监督学习</li>
-            </ul>
-        </body>
-        </html>
-        """
-        url = "https://example.com/ml-guide-cn"
-        result = parse_content(html, url)
-
-        assert result["meta"]["title"] == "机器学习入门指南"
-        assert len(result["content"]["headings"]) >= 1
-        assert len(result["content"]["paragraphs"]) >= 2
+        assert parsed_zh_cn["meta"]["title"] == "机器学习入门指南"
+        assert len(parsed_zh_cn["content"]["headings"]) >= 1
+        assert len(parsed_zh_cn["content"]["paragraphs"]) >= 2
 
-    def test_parse_japanese_content(self):
+    def test_parse_japanese_content(self, parsed_ja):
         """Japanese HTML should be parsed correctly."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="ja">
-        <head>
-            <title>機械学習入門ガイド</title>
-            <meta name="description" content="機械学習の基礎を学ぶ。">
-        </head>
-        <body>
-            <h1>機械学習とは</h1>
-            <p>機械学習とは、コンピュータがデータから学習することを可能にする人工知能の一分野です。</p>
-            <p>2024年の調査によると、85%の企業がAI技術を使用しています。</p>
-            <h2>学習の種類</h2>
-            <ul>
-                <li>教師あり学習</li>
-                <li>教師なし学習</li>
-                <li>強化学習</li>
-            </ul>
-        </body>
-        </html>
-        """
-        url = "https://example.com/ml-guide-ja"
-        result = parse_content(html, url)
-
-        assert result["meta"]["title"] == "機械学習入門ガイド"
-        assert len(result["content"]["headings"]) >= 2
-        assert len(result["content"]["paragraphs"]) >= 2
+        assert parsed_ja["meta"]["title"] == "機械学習入門ガイド"
+        assert len(parsed_ja["content"]["headings"]) >= 2
+        assert len(parsed_ja["content"]["paragraphs"]) >= 2
         # Lists may or may not be extracted depending on HTML structure
-        lists = result["content"].get("lists", [])
+        lists = parsed_ja["content"].get("lists", [])
         assert isinstance(lists, list)
 
 
@@ -396,63 +439,14 @@ class TestMultilingualReadability:
 class TestMultilingualSchemaOrg:
     """Tests for Schema.org extraction with multilingual content."""
 
-    def test_schema_org_chinese_content(self):
+    def test_schema_org_chinese_content(self, parsed_zh_tw_schema):
         """Schema.org should be extracted from Chinese pages."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="zh-TW">
-        <head>
-            <title>機器學習指南</title>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "Article",
-                "headline": "機器學習完整指南",
-                "author": {"@type": "Person", "name": "張三"}
-            }
-            </script>
-        </head>
-        <body>
-            <h1>機器學習指南</h1>
-            <p>這是一篇關於機器學習的文章。</p>
-        </body>
-        </html>
-        """
-        result = parse_content(html, "https://example.com")
-        schema = result.get("schema_org", {})
+        schema = parsed_zh_tw_schema.get("schema_org", {})
         assert schema.get("available") is True
         assert "Article" in schema.get("types_found", [])
 
-    def test_schema_org_japanese_faq(self):
+    def test_schema_org_japanese_faq(self, parsed_ja_faq):
         """FAQ Schema.org should be extracted from Japanese pages."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="ja">
-        <head>
-            <title>よくある質問</title>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "FAQPage",
-                "mainEntity": [{
-                    "@type": "Question",
-                    "name": "機械学習とは何ですか？",
-                    "acceptedAnswer": {
-                        "@type": "Answer",
-                        "text": "機械学習はAIの一分野です。"
-                    }
-                }]
-            }
-            </script>
-        </head>
-        <body>
-            <h1>よくある質問</h1>
-            <h2>機械学習とは何ですか？</h2>
-            <p>機械学習はAIの一分野です。</p>
-        </body>
-        </html>
-        """
-        result = parse_content(html, "https://example.com")
-        schema = result.get("schema_org", {})
+        schema = parsed_ja_faq.get("schema_org", {})
         assert schema.get("available") is True
         assert schema.get("has_faq") is True
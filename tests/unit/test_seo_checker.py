@@ -1,6 +1,8 @@
 """Unit tests for SEO checker module."""
 from __future__ import annotations
 
+import pytest
+
 from src.seo.seo_checker import (
     Severity,
     _check_canonical,
@@ -10,6 +12,10 @@ from src.seo.seo_checker import (
     check_seo,
 )
 
+# Keep this module on one xdist worker (--dist loadgroup) so the session-scoped
+# parsed_noindex is built once; other modules still shard across workers
+pytestmark = pytest.mark.xdist_group(name="seo_checker")
+
 
 class TestTitleChecks:
     """Tests for title tag validation."""
@@ -163,11 +169,9 @@ class TestFullSEOCheck:
             assert "severity" in item
             assert "message" in item
 
-    def test_check_seo_sorted_by_severity(self, html_noindex: str):
+    def test_check_seo_sorted_by_severity(self, html_noindex: str, parsed_noindex: dict):
         """Issues should be sorted by severity (errors first)."""
-        from src.parser.content_parser import parse_content
-        parsed = parse_content(html_noindex, "https://example.com")
-        result = check_seo(parsed, html_noindex)
+        result = check_seo(parsed_noindex, html_noindex)
 
         # Find severity positions
         severities = [r["severity"] for r in result]
@@ -1,26 +1,22 @@
 """Tests for webhook URL validation and pinning resolution."""
 from __future__ import annotations
 
-import socket
+import itertools
+from collections.abc import Callable
+from types import SimpleNamespace
 
 import pytest
 
 from src.config.settings import settings
-from src.security.url_guard import resolve_webhook_target, validate_webhook_url
-
+from src.security import url_guard
+from src.security.url_guard import (
+    UnsafeWebhookTarget,
+    resolve_webhook_target,
+    validate_webhook_url,
+)
 
-def _addrinfo_for(ip_str: str, port: int = 443):
-    if ":" in ip_str:
-        return [
-            (
-                socket.AF_INET6,
-                socket.SOCK_STREAM,
-                6,
-                "",
-                (ip_str, port, 0, 0),
-            )
-        ]
-    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip_str, port))]
+# One shared body chunk; streamed responses repeat it without new allocations
+_CHUNK = b"x" * 8192
 
 
 @pytest.fixture(autouse=True)
@@ -29,35 +25,32 @@ def reset_allowlists(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(settings.security, "webhook_cidr_allowlist", [])
 
 
-@pytest.mark.parametrize(
-    "ip_str",
-    [
-        "10.1.2.3",
-        "172.16.5.4",
-        "192.168.1.2",
-        "127.0.0.1",
-        "169.254.10.10",
-        "100.64.0.8",
-        "0.0.0.5",
-        "224.0.0.1",
-        "240.0.0.1",
-        "::1",
-        "fe80::1",
-        "fc00::1",
-        "::",
-        "ff00::1",
-        "::ffff:192.168.1.10",
-    ],
+# One address per denylisted range, built once at import
+_DENYLISTED_IPS = (
+    pytest.param("10.1.2.3", id="private-10"),
+    pytest.param("172.16.5.4", id="private-172.16"),
+    pytest.param("192.168.1.2", id="private-192.168"),
+    pytest.param("127.0.0.1", id="loopback"),
+    pytest.param("169.254.10.10", id="link-local"),
+    pytest.param("100.64.0.8", id="cgnat"),
+    pytest.param("0.0.0.5", id="this-network"),
+    pytest.param("224.0.0.1", id="multicast"),
+    pytest.param("240.0.0.1", id="reserved"),
+    pytest.param("::1", id="ipv6-loopback"),
+    pytest.param("fe80::1", id="ipv6-link-local"),
+    pytest.param("fc00::1", id="ipv6-unique-local"),
+    pytest.param("::", id="ipv6-unspecified"),
+    pytest.param("ff00::1", id="ipv6-multicast"),
+    pytest.param("::ffff:192.168.1.10", id="ipv4-mapped-private"),
 )
+
+
+@pytest.mark.parametrize("ip_str", _DENYLISTED_IPS)
 def test_validate_webhook_url_blocks_denylisted_ranges(
     ip_str: str,
-    monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
 ) -> None:
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *args, **kwargs: _addrinfo_for(ip_str),
-    )
+    fake_dns(ip_str)
 
     is_valid, reason = validate_webhook_url("https://hooks.example.com/test")
 
@@ -73,13 +66,9 @@ def test_validate_webhook_url_rejects_non_http_scheme() -> None:
 
 
 def test_validate_webhook_url_accepts_public_https_url(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
 ) -> None:
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *args, **kwargs: _addrinfo_for("8.8.8.8"),
-    )
+    fake_dns("8.8.8.8")
 
     is_valid, reason = validate_webhook_url("https://hooks.example.com/test?via=1")
     target = resolve_webhook_target("https://hooks.example.com/test?via=1")
@@ -93,12 +82,9 @@ def test_validate_webhook_url_accepts_public_https_url(
 
 def test_cidr_allowlist_can_bypass_blocked_ip(
     monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
 ) -> None:
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *args, **kwargs: _addrinfo_for("100.64.1.20"),
-    )
+    fake_dns("100.64.1.20")
     monkeypatch.setattr(settings.security, "webhook_cidr_allowlist", ["100.64.0.0/10"])
 
     is_valid, reason = validate_webhook_url("https://hooks.example.com/test")
@@ -109,12 +95,9 @@ def test_cidr_allowlist_can_bypass_blocked_ip(
 
 def test_host_allowlist_can_bypass_blocked_ip(
     monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
 ) -> None:
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *args, **kwargs: _addrinfo_for("127.0.0.1"),
-    )
+    fake_dns("127.0.0.1")
     monkeypatch.setattr(settings.security, "webhook_host_allowlist", ["hooks.example.com"])
 
     is_valid, reason = validate_webhook_url("https://hooks.example.com/test")
@@ -125,15 +108,12 @@ def test_host_allowlist_can_bypass_blocked_ip(
 
 def test_respect_allowlist_false_ignores_host_allowlist(
     monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
 ) -> None:
     """fetch path passes respect_allowlist=False; allowlist must NOT bypass IP check."""
     from src.security.url_guard import UnsafeWebhookTarget, resolve_webhook_target
 
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *args, **kwargs: _addrinfo_for("127.0.0.1"),
-    )
+    fake_dns("127.0.0.1")
     monkeypatch.setattr(settings.security, "webhook_host_allowlist", ["evil.example.com"])
     monkeypatch.setattr(settings.security, "webhook_cidr_allowlist", ["127.0.0.0/8"])
 
@@ -156,3 +136,61 @@ def test_invalid_port_returns_validation_error() -> None:
     from src.security.url_guard import resolve_webhook_target
     with pytest.raises(WebhookValidationError):
         resolve_webhook_target("https://hooks.example.com:99999/x")
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Content-Length": str(1024 * 1024)}],
+    ids=["streamed", "content_length"],
+)
+def test_pinned_fetch_rejects_oversized_response(
+    headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[[str], None],
+) -> None:
+    """Oversized bodies abort on the header or mid-stream, never fully buffered."""
+    fake_dns("8.8.8.8")
+    response = SimpleNamespace(
+        status=200,
+        headers=headers,
+        stream=lambda *args, **kwargs: itertools.repeat(_CHUNK),
+        release_conn=lambda: None,
+    )
+    pool = SimpleNamespace(urlopen=lambda *args, **kwargs: response, close=lambda: None)
+    monkeypatch.setattr(url_guard, "_build_pool", lambda target, timeout: pool)
+
+    with pytest.raises(ValueError, match="Response too large"):
+        url_guard.pinned_fetch("https://example.com/", max_size=4 * len(_CHUNK))
+
+
+@pytest.mark.parametrize(
+    "location,blocked_host,resolved_ip",
+    [
+        ("http://intranet.example.com/admin", "intranet.example.com", "192.168.1.1"),
+        ("http://127.0.0.1:8080/internal", "127.0.0.1", "127.0.0.1"),
+    ],
+    ids=["hostname_to_private", "loopback_literal"],
+)
+def test_pinned_fetch_blocks_redirect_to_internal_target(
+    location: str,
+    blocked_host: str,
+    resolved_ip: str,
+    monkeypatch: pytest.MonkeyPatch,
+    fake_dns: Callable[..., None],
+) -> None:
+    """Every redirect hop is re-validated before a connection is opened."""
+    fake_dns("93.184.216.34", {blocked_host: resolved_ip})
+    redirect = SimpleNamespace(
+        status=302, headers={"Location": location}, release_conn=lambda: None
+    )
+    pools: list[str] = []
+
+    def _build_pool(target, timeout):
+        pools.append(target.pinned_ip)
+        return SimpleNamespace(urlopen=lambda *args, **kwargs: redirect, close=lambda: None)
+
+    monkeypatch.setattr(url_guard, "_build_pool", _build_pool)
+
+    with pytest.raises(UnsafeWebhookTarget):
+        url_guard.pinned_fetch("https://example.com/start")
+    assert pools == ["93.184.216.34"]